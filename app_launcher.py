@@ -6,16 +6,19 @@ Always updates yt-dlp to the latest version on startup.
 """
 
 import os
+import re
 import sys
 import multiprocessing
 import subprocess
 import webbrowser
 import time
 import threading
+import shutil
 import signal
 import socket
 import tempfile
 import atexit
+from functools import lru_cache
 
 # Prevent fork-bomb on macOS when frozen
 multiprocessing.freeze_support()
@@ -23,6 +26,13 @@ multiprocessing.freeze_support()
 # Flag to track if browser was opened
 _browser_opened = False
 
+# PyInstaller sets these before any of our code runs; they never change after
+_FROZEN = getattr(sys, 'frozen', False)
+_BUNDLE_DIR = sys._MEIPASS if _FROZEN else os.path.dirname(os.path.abspath(__file__))
+
+# KEY=value lines of a .env file (comments and blank lines never match)
+_ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$', re.MULTILINE)
+
 # Single-instance lock file
 _lock_file_path = os.path.join(tempfile.gettempdir(), 'community-highlighter.lock')
 _lock_file_handle = None
@@ -66,32 +76,38 @@ def release_instance_lock():
 
 def get_app_path():
     """Get the path to the app bundle or development directory."""
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # Running as a bundled app
         return os.path.dirname(sys.executable)
-    else:
-        # Running in development
-        return os.path.dirname(os.path.abspath(__file__))
+    # Running in development
+    return _BUNDLE_DIR
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """Get the path to a resource, works for dev and PyInstaller."""
-    if getattr(sys, 'frozen', False):
-        # Running as bundled app - resources are in the app bundle
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_path, relative_path)
+    # Bundled app: resources are in the unpacked bundle (_MEIPASS)
+    return os.path.join(_BUNDLE_DIR, relative_path)
+
+# Resolved once at import; the bundle layout can't change while we run
+_RESOURCE_DIR = get_resource_path('')
+_BACKEND_DIR = get_resource_path('backend')
+_ENV_PATHS = (
+    os.path.join(get_app_path(), '.env'),
+    os.path.join(os.path.expanduser('~'), '.community-highlighter', '.env'),
+    os.path.join(_RESOURCE_DIR, '.env'),
+)
 
 def is_port_in_use(port):
     """Check if a port is already in use."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         return s.connect_ex(('127.0.0.1', port)) == 0
 
+@lru_cache(maxsize=1)
 def find_ffmpeg():
     """Find ffmpeg, checking common locations."""
     # Check if bundled
     bundled_ffmpeg = get_resource_path('ffmpeg')
-    if os.path.exists(bundled_ffmpeg):
+    if os.path.isfile(bundled_ffmpeg):
         return bundled_ffmpeg
     
     # Check common Homebrew locations
@@ -102,18 +118,11 @@ def find_ffmpeg():
     ]
     
     for path in common_paths:
-        if os.path.exists(path):
+        if os.path.isfile(path):
             return path
     
-    # Try to find in PATH
-    try:
-        result = subprocess.run(['which', 'ffmpeg'], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except:
-        pass
-    
-    return None
+    # Try to find in PATH (no `which` subprocess needed)
+    return shutil.which('ffmpeg')
 
 def update_yt_dlp():
     """Update yt-dlp to the latest nightly version for best YouTube compatibility."""
@@ -140,24 +149,29 @@ def update_yt_dlp():
     except Exception as e:
         print(f"⚠️ Could not update yt-dlp: {e}")
 
-def load_env_file():
-    """Load environment variables from .env file."""
-    env_locations = [
-        os.path.join(get_app_path(), '.env'),
-        os.path.join(os.path.expanduser('~'), '.community-highlighter', '.env'),
-        os.path.join(get_resource_path(''), '.env'),
-    ]
+def load_env_file(overwrite=False):
+    """Load environment variables from .env file.
     
-    for env_path in env_locations:
-        if os.path.exists(env_path):
-            print(f"📁 Loading environment from: {env_path}")
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip().strip('"').strip("'")
-            return True
+    Like python-dotenv, variables already set in the environment win unless
+    overwrite=True; skipping them also avoids a putenv per duplicate key.
+    """
+    for env_path in _ENV_PATHS:
+        # .env files are tiny: one open + one read, no exists() stat first
+        try:
+            fd = os.open(env_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            text = os.read(fd, 1 << 20).decode('utf-8', 'replace')
+        finally:
+            os.close(fd)
+        print(f"📁 Loading environment from: {env_path}")
+        os.environ.update({
+            m.group(1): m.group(2).strip().strip('"').strip("'")
+            for m in _ENV_LINE_RE.finditer(text)
+            if overwrite or m.group(1) not in os.environ
+        })
+        return True
     
     print("⚠️ No .env file found. Create one at ~/.community-highlighter/.env")
     print("   Add: OPENAI_API_KEY=your-key-here")
@@ -214,6 +228,18 @@ def main():
     app_path = get_app_path()
     os.chdir(app_path)
     
+    # Update yt-dlp in the background so it doesn't hold up server startup;
+    # code that needs yt-dlp waits on ytdlp_updated (see YTDLP_READY in backend/app.py)
+    ytdlp_updated = threading.Event()
+    
+    def _update_yt_dlp_in_background():
+        try:
+            update_yt_dlp()
+        finally:
+            ytdlp_updated.set()
+    
+    threading.Thread(target=_update_yt_dlp_in_background, daemon=True).start()
+    
     # Load environment variables
     if not load_env_file():
         print("\n" + "=" * 60)
@@ -236,19 +262,15 @@ def main():
         print("⚠️ ffmpeg not found. Video features may not work.")
         print("   Install with: brew install ffmpeg")
     
-    # Update yt-dlp SYNCHRONOUSLY to ensure it's ready
-    update_yt_dlp()
-    
     # Set desktop mode - enables all video features
     os.environ['DESKTOP_MODE'] = 'true'
     
     # Import and run the app
     print("\n🚀 Starting server...")
     
-    # Add backend to path
-    backend_path = get_resource_path('backend')
-    if os.path.exists(backend_path):
-        sys.path.insert(0, backend_path)
+    # Put the app root (for "backend.app") ahead of backend/ on the path
+    candidates = [_RESOURCE_DIR] + ([_BACKEND_DIR] if os.path.isdir(_BACKEND_DIR) else [])
+    sys.path[:0] = [p for p in candidates if p not in sys.path]
     
     # Open browser ONCE after delay
     open_browser_once('http://127.0.0.1:8000', delay=3)
@@ -256,10 +278,13 @@ def main():
     # Import and run
     try:
         # Try to import the app module
-        sys.path.insert(0, get_resource_path(''))
+        import backend.app as backend_app
         from backend.app import app
         import uvicorn
         
+        # Hand the update event to the server before it starts taking requests
+        backend_app.YTDLP_READY = ytdlp_updated
+        
         print("🌐 Browser will open to http://127.0.0.1:8000")
         print("\n" + "=" * 60)
         print("Desktop Features Enabled:")
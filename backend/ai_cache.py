@@ -9,7 +9,8 @@ import os
 from datetime import datetime, timedelta
 from typing import Any, Optional, Callable
 
-CACHE_DIR = './ai_cache'
+# Launchers pass an absolute path; plain server runs keep the CWD-relative default
+CACHE_DIR = os.environ.get('AI_CACHE_DIR', './ai_cache')
 CACHE_DURATION_DAYS = 30
 
 def ensure_cache_dir():
@@ -1,12 +1,10 @@
-import os, sys, json, uuid, tempfile, shutil, subprocess, threading, re, html, asyncio
-from collections import Counter, defaultdict
+import os, sys, json, uuid, tempfile, shutil, subprocess, threading, re, html, asyncio, zlib, heapq
+from collections import Counter, defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager
+from functools import lru_cache, partial
 from datetime import datetime
 from urllib.parse import quote, unquote
-import nltk
-from nltk.corpus import stopwords
-from textblob import TextBlob
 from typing import List, Dict, Any, Optional
 from fastapi import (
     FastAPI,
@@ -30,7 +28,6 @@ except ImportError:
     WEBSHARE_IMPORT_OK = False
     print("[!] youtube-transcript-api proxy support not available - update the package")
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
-import yt_dlp
 import zipfile
 import httpx
 import time
@@ -38,10 +35,36 @@ import time
 # NEW IMPORTS FOR ENHANCED FEATURES (v4.0)
 import numpy as np
 
+# Aho-Corasick lets fix_brooklyn find every name in one pass - optional
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# FAISS speeds up unfiltered KB similarity search - optional, numpy otherwise
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# orjson serializes live broadcast payloads and parses API responses
+# faster - optional, stdlib otherwise
+try:
+    import orjson
+
+    def dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    loads_json = json.loads
+
 # ChromaDB and embeddings - optional for cloud deployment
 try:
     import chromadb
-    from chromadb.utils import embedding_functions
     CHROMADB_AVAILABLE = True
     print("[KB] chromadb imported OK")
     try:
@@ -66,16 +89,94 @@ except Exception as e:
 LIVE_CHAT_AVAILABLE = False
 
 
+_BROOKLYN_RE = re.compile(r'\bBrooklyn\b', re.IGNORECASE)
+_MLK_RE = re.compile(r'\bMartin Luther\b(?! King)', re.IGNORECASE)
+
+def _brookline_like(s):
+    """Keep the casing of the matched word (BROOKLYN -> BROOKLINE, etc.)."""
+    return 'BROOKLINE' if s.isupper() else ('brookline' if s.islower() else 'Brookline')
+
+def _brooklyn_repl(m):
+    return _brookline_like(m.group(0))
+
+def _build_name_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in ('brooklyn', 'martin luther'):
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+_NAME_AUTOMATON = _build_name_automaton()
+
+def _is_word_boundary(text, pos):
+    """Same test as regex \\b: word/non-word transition at pos."""
+    before = pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == '_')
+    after = pos < len(text) and (text[pos].isalnum() or text[pos] == '_')
+    return before != after
+
+def _fix_names_single_pass(text):
+    """Brooklyn -> Brookline and Martin Luther -> Martin Luther King in one scan.
+    
+    Returns None when the automaton can't be used, so the caller falls back
+    to the compiled regexes.
+    """
+    lower = text.lower()
+    # Offsets into the lowered copy must line up with the original
+    if _NAME_AUTOMATON is None or len(lower) != len(text):
+        return None
+    parts = []
+    pos = 0
+    for end, word in _NAME_AUTOMATON.iter(lower):
+        start = end - len(word) + 1
+        end += 1
+        if not (_is_word_boundary(lower, start) and _is_word_boundary(lower, end)):
+            continue
+        if word == 'brooklyn':
+            replacement = _brookline_like(text[start:end])
+        elif lower.startswith(' king', end):
+            continue
+        else:
+            replacement = 'Martin Luther King'
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return ''.join(parts)
+
 def fix_brooklyn(text):
     """Replace Brooklyn with Brookline, fix Martin Luther, and fix encoding artifacts."""
     if not text:
         return text
-    import re
-    text = re.sub(r'\bBrooklyn\b', 'Brookline', text)
-    text = re.sub(r'\bBROOKLYN\b', 'BROOKLINE', text)
-    text = re.sub(r'\bbrooklyn\b', 'brookline', text)
-    # v6.0: Fix Martin Luther truncation - always use full name
-    text = re.sub(r'\bMartin Luther\b(?! King)', 'Martin Luther King', text, flags=re.IGNORECASE)
+    return _fix_stray_a(_fix_names_and_mojibake(text))
+
+def fix_brooklyn_batch(texts):
+    """fix_brooklyn over a list of strings, sharing one pass between them.
+    
+    The texts are joined on NUL (a non-word character, so \\b matches the
+    way it does at string edges) and split back after the literal fixes;
+    only the anchored stray-â cleanup still runs per text.
+    """
+    if len(texts) < 2 or any('\x00' in t for t in texts):
+        return [fix_brooklyn(t) for t in texts]
+    joined = _fix_names_and_mojibake('\x00'.join(texts))
+    return [_fix_stray_a(t) for t in joined.split('\x00')]
+
+_STRAY_A_SPACE_RE = re.compile(r'â\s')
+_STRAY_A_END_RE = re.compile(r'â$')
+_STRAY_A_BETWEEN_RE = re.compile(r'(?<=\S)\s*â\s*(?=\S)')
+
+def _fix_names_and_mojibake(text):
+    fixed = _fix_names_single_pass(text)
+    if fixed is not None:
+        text = fixed
+    else:
+        text = _BROOKLYN_RE.sub(_brooklyn_repl, text)
+        # v6.0: Fix Martin Luther truncation - always use full name
+        text = _MLK_RE.sub('Martin Luther King', text)
     # v8.0: Fix UTF-8 double-encoding artifacts (â€", â€™, â€œ, etc.)
     text = text.replace('\u00e2\u0080\u0094', '\u2014')  # em dash —
     text = text.replace('\u00e2\u0080\u0093', '\u2013')  # en dash –
@@ -95,16 +196,42 @@ def fix_brooklyn(text):
     text = text.replace('â\x80\x94', '\u2014')
     text = text.replace('â\x80\x93', '\u2013')
     text = text.replace('â\x80\x99', '\u2019')
+    return text
+
+def _fix_stray_a(text):
     # Catch any remaining standalone â (mojibake artifact, not a real word character)
+    if 'â' not in text:
+        return text
     # Replace â followed by space/punctuation with em dash
-    text = re.sub(r'â\s', '\u2014 ', text)
+    text = _STRAY_A_SPACE_RE.sub('\u2014 ', text)
     # Replace â at end of string
-    text = re.sub(r'â$', '\u2014', text)
+    text = _STRAY_A_END_RE.sub('\u2014', text)
     # Replace â between punctuation/words (e.g., "MA â March")
-    text = re.sub(r'(?<=\S)\s*â\s*(?=\S)', ' \u2014 ', text)
+    text = _STRAY_A_BETWEEN_RE.sub(' \u2014 ', text)
     return text
 
 
+# nltk and textblob are imported on first use; they add noticeably to
+# server start-up and most requests never touch them
+_english_stopwords = None
+
+def get_english_stopwords():
+    """NLTK's English stopword list, downloading it on first use if needed."""
+    global _english_stopwords
+    if _english_stopwords is None:
+        import nltk
+        from nltk.corpus import stopwords
+        try:
+            _english_stopwords = frozenset(stopwords.words("english"))
+        except LookupError:
+            try:
+                nltk.download("stopwords", quiet=True)
+                _english_stopwords = frozenset(stopwords.words("english"))
+            except Exception:
+                return frozenset()
+    return _english_stopwords
+
+
 # AI Optimization Support (optional)
 try:
     from ai_cache import cached_ai_analysis, get_cache_stats, clear_cache, get_cached_result, save_to_cache
@@ -220,7 +347,6 @@ WEBSHARE_PROXY_HOST = os.getenv("WEBSHARE_PROXY_HOST", "p.webshare.io:80")
 # Build proxy URL with proper URL encoding for special characters
 WEBSHARE_PROXY_URL = None
 if WEBSHARE_PROXY_USERNAME and WEBSHARE_PROXY_PASSWORD:
-    from urllib.parse import quote
     # URL-encode credentials in case they have special characters like @, #, etc.
     # Add -1 suffix for rotating residential proxies (Webshare session format)
     username_with_session = WEBSHARE_PROXY_USERNAME
@@ -230,10 +356,8 @@ if WEBSHARE_PROXY_USERNAME and WEBSHARE_PROXY_PASSWORD:
     encoded_user = quote(username_with_session, safe='')
     encoded_pass = quote(WEBSHARE_PROXY_PASSWORD, safe='')
     
-    proxy_host = WEBSHARE_PROXY_HOST
-    
-    WEBSHARE_PROXY_URL = f"http://{encoded_user}:{encoded_pass}@{proxy_host}/"
-    print(f"[OK] Proxy URL built: {username_with_session}@{proxy_host}")
+    WEBSHARE_PROXY_URL = f"http://{encoded_user}:{encoded_pass}@{WEBSHARE_PROXY_HOST}/"
+    print(f"[OK] Proxy URL built: {username_with_session}@{WEBSHARE_PROXY_HOST}")
 
 # Initialize YouTube Transcript API - with proxy if available
 if WEBSHARE_IMPORT_OK and WEBSHARE_PROXY_USERNAME and WEBSHARE_PROXY_PASSWORD:
@@ -270,6 +394,29 @@ else:
     YTDLP_BIN = "yt-dlp"  # fallback to bare name
     print("[!] yt-dlp not found in PATH - video downloads may fail")
 
+# Set while no yt-dlp update is in flight. The desktop launcher swaps in its own
+# (unset) event before the server starts and sets it once its update has finished.
+YTDLP_READY = threading.Event()
+YTDLP_READY.set()
+
+def wait_for_ytdlp_update(job=None):
+    """Block until a background yt-dlp update has finished (max 3 minutes)."""
+    if YTDLP_READY.is_set():
+        return
+    if job is not None:
+        job["message"] = "Waiting for yt-dlp update to finish..."
+    print("[yt-dlp] Waiting for background update to finish...")
+    YTDLP_READY.wait(timeout=180)
+
+async def load_yt_dlp():
+    """The yt_dlp module, imported on first use and only after any in-flight
+    update: importing it mid-update can load a half-replaced package, and
+    once imported the process keeps that version for good."""
+    if not YTDLP_READY.is_set():
+        await asyncio.to_thread(wait_for_ytdlp_update)
+    import yt_dlp
+    return yt_dlp
+
 # Bundled font for reliable cross-platform text rendering
 FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
 FONT_DEJAVU_BOLD = os.path.join(FONTS_DIR, "DejaVuSans-Bold.ttf")
@@ -337,12 +484,29 @@ async def periodic_cache_cleanup():
         await asyncio.sleep(6 * 3600)
         cleanup_cache()
 
+# Shared HTTP clients: keep-alive connections (and their TLS sessions) to
+# OpenAI / Google APIs are reused across requests instead of rebuilt per call
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+# HTTP/2 lets concurrent async requests to the same host (bursts of YouTube
+# Data API calls) share one connection - needs the optional h2 package;
+# hosts that don't speak it are still reached over HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+HTTP_CLIENT = httpx.Client(limits=_HTTP_LIMITS)
+HTTP_ASYNC = httpx.AsyncClient(limits=_HTTP_LIMITS, http2=_HTTP2)
+
 @asynccontextmanager
 async def lifespan(app):
     cleanup_cache()
     task = asyncio.create_task(periodic_cache_cleanup())
     yield
     task.cancel()
+    await HTTP_ASYNC.aclose()
+    HTTP_CLIENT.close()
+    _AI_CALL_POOL.shutdown(wait=False, cancel_futures=True)
 
 app = FastAPI(lifespan=lifespan)
 app.add_middleware(
@@ -369,24 +533,18 @@ def find_dist_dir():
     print(f"[DEBUG] Script directory: {script_dir}")
     print(f"[DEBUG] Searching for dist folder in:")
     
+    # One stat per distinct candidate (the parent-dir entries resolve to the
+    # same path); the assets listing is printed once, below, when mounting
+    seen = set()
     for candidate in candidates:
         abs_candidate = os.path.abspath(candidate)
-        exists = os.path.exists(abs_candidate)
-        has_assets = os.path.exists(os.path.join(abs_candidate, "assets")) if exists else False
-        print(f"  - {abs_candidate} (exists={exists}, has_assets={has_assets})")
+        if abs_candidate in seen:
+            continue
+        seen.add(abs_candidate)
+        has_assets = os.path.isdir(os.path.join(abs_candidate, "assets"))
+        print(f"  - {abs_candidate} (has_assets={has_assets})")
         
-        if exists and has_assets:
-            # List the assets to verify
-            assets_dir = os.path.join(abs_candidate, "assets")
-            try:
-                files = os.listdir(assets_dir)
-                print(f"    Found {len(files)} files in assets/")
-                for f in files[:5]:  # Show first 5
-                    print(f"      - {f}")
-                if len(files) > 5:
-                    print(f"      ... and {len(files) - 5} more")
-            except Exception as e:
-                print(f"    Error listing assets: {e}")
+        if has_assets:
             return abs_candidate
     
     return None
@@ -401,13 +559,13 @@ if DIST_DIR:
     try:
         # List what files exist in assets
         print(f"[DEBUG] Assets directory: {DIST_ASSETS_DIR}")
-        if os.path.exists(DIST_ASSETS_DIR):
-            asset_files = os.listdir(DIST_ASSETS_DIR)
+        if os.path.isdir(DIST_ASSETS_DIR):
+            with os.scandir(DIST_ASSETS_DIR) as entries:
+                asset_files = sorted(entries, key=lambda e: e.name)
             print(f"[DEBUG] Found {len(asset_files)} asset files:")
-            for f in sorted(asset_files)[:10]:
-                fpath = os.path.join(DIST_ASSETS_DIR, f)
-                fsize = os.path.getsize(fpath) if os.path.isfile(fpath) else 0
-                print(f"        - {f} ({fsize:,} bytes)")
+            for entry in asset_files[:10]:
+                fsize = entry.stat().st_size if entry.is_file() else 0
+                print(f"        - {entry.name} ({fsize:,} bytes)")
             if len(asset_files) > 10:
                 print(f"        ... and {len(asset_files) - 10} more files")
         else:
@@ -518,6 +676,200 @@ def check_rate_limit(request, limiter=None):
 # Initialize ChromaDB only if available
 # KB_PERSIST_DIR allows persistent volume mount in cloud deployments
 chroma_db_path = os.environ.get("KB_PERSIST_DIR", os.path.join(KB_DIR, "chroma_db"))
+
+class BatchedEmbeddingFunction:
+    """Chroma embedding function that encodes each add/query in 64-doc batches.
+    
+    Wraps the already-loaded model so it is shared with the rest of the KB code.
+    """
+
+    def __init__(self, model, batch_size=64):
+        self.model = model
+        self.batch_size = batch_size
+
+    def __call__(self, input):
+        return self.model.encode(
+            list(input), batch_size=self.batch_size, convert_to_numpy=True
+        ).tolist()
+
+class QuantizedMiniLM:
+    """INT8 ONNX Runtime build of all-MiniLM-L6-v2 with SentenceTransformer's
+    encode() interface (mean pooling + L2 normalisation, 256-token limit)."""
+
+    def __init__(self, model, tokenizer):
+        self.model = model
+        self.tokenizer = tokenizer
+
+    def encode(self, sentences, batch_size=64, convert_to_numpy=True):
+        out = []
+        for i in range(0, len(sentences), batch_size):
+            batch = self.tokenizer(
+                sentences[i:i + batch_size], padding=True, truncation=True,
+                max_length=256, return_tensors="np",
+            )
+            hidden = self.model(**batch).last_hidden_state
+            mask = batch["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out.append(pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None))
+        return np.concatenate(out) if out else np.zeros((0, 384), dtype=np.float32)
+
+def load_quantized_minilm(cache_dir):
+    """Export + quantize MiniLM once into cache_dir and load it (optional, needs optimum)."""
+    import platform
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except ImportError:
+        return None
+
+    model_id = "sentence-transformers/all-MiniLM-L6-v2"
+    quantized_dir = os.path.join(cache_dir, "all-MiniLM-L6-v2-int8")
+    try:
+        if not os.path.isfile(os.path.join(quantized_dir, "model_quantized.onnx")):
+            print("[KB] Building INT8 ONNX embedding model (first run only)...")
+            onnx_dir = os.path.join(cache_dir, "all-MiniLM-L6-v2-onnx")
+            ORTModelForFeatureExtraction.from_pretrained(model_id, export=True).save_pretrained(onnx_dir)
+            if platform.machine().lower() in ("arm64", "aarch64"):
+                qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+            else:
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            ORTQuantizer.from_pretrained(onnx_dir).quantize(save_dir=quantized_dir, quantization_config=qconfig)
+            AutoTokenizer.from_pretrained(model_id).save_pretrained(quantized_dir)
+        model = ORTModelForFeatureExtraction.from_pretrained(quantized_dir, file_name="model_quantized.onnx")
+        tokenizer = AutoTokenizer.from_pretrained(quantized_dir)
+    except Exception as e:
+        print(f"[KB] INT8 embedding model unavailable, using SentenceTransformer: {e}")
+        return None
+    return QuantizedMiniLM(model, tokenizer)
+
+class InMemoryKBCollection:
+    """Chroma collection wrapper that answers query() from an in-memory copy
+    of the embeddings instead of going through Chroma's SQLite layer.
+    
+    The copy is loaded on the first query and reloaded after any write that
+    goes through this wrapper. Distances are squared L2, same as Chroma's
+    default space. Where-clauses other than plain equality / $ne on
+    metadata fields are passed through to Chroma unchanged.
+    """
+
+    def __init__(self, collection, embedding_function):
+        self._collection = collection
+        self._embed = embedding_function
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = -1
+        self._ids = []
+        self._documents = []
+        self._metadatas = []
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._faiss_index = None
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def _changed(self):
+        with self._lock:
+            self._version += 1
+
+    def add(self, *args, **kwargs):
+        try:
+            return self._collection.add(*args, **kwargs)
+        finally:
+            self._changed()
+
+    def upsert(self, *args, **kwargs):
+        try:
+            return self._collection.upsert(*args, **kwargs)
+        finally:
+            self._changed()
+
+    def update(self, *args, **kwargs):
+        try:
+            return self._collection.update(*args, **kwargs)
+        finally:
+            self._changed()
+
+    def delete(self, *args, **kwargs):
+        try:
+            return self._collection.delete(*args, **kwargs)
+        finally:
+            self._changed()
+
+    def _snapshot(self):
+        with self._lock:
+            if self._loaded_version != self._version:
+                version = self._version
+                data = self._collection.get(include=["embeddings", "documents", "metadatas"])
+                vectors = np.asarray(data["embeddings"] or [], dtype=np.float32)
+                self._ids = data["ids"]
+                self._documents = data["documents"]
+                self._metadatas = [m or {} for m in data["metadatas"]]
+                self._vectors = vectors
+                self._sq_norms = (vectors * vectors).sum(axis=1) if len(vectors) else np.zeros(0, dtype=np.float32)
+                self._faiss_index = None
+                if faiss is not None and len(vectors):
+                    self._faiss_index = faiss.IndexFlatL2(vectors.shape[1])
+                    self._faiss_index.add(vectors)
+                self._loaded_version = version
+            return self._ids, self._documents, self._metadatas, self._vectors, self._sq_norms, self._faiss_index
+
+    @staticmethod
+    def _supported_where(where):
+        if not where:
+            return True
+        for key, cond in where.items():
+            if key.startswith("$"):
+                return False
+            if isinstance(cond, dict) and (len(cond) != 1 or "$ne" not in cond):
+                return False
+        return True
+
+    @staticmethod
+    def _matches(meta, where):
+        for key, cond in where.items():
+            if isinstance(cond, dict):
+                if meta.get(key) == cond["$ne"]:
+                    return False
+            elif meta.get(key) != cond:
+                return False
+        return True
+
+    def query(self, query_texts=None, n_results=10, where=None, **kwargs):
+        if query_texts is None or kwargs or not self._supported_where(where):
+            return self._collection.query(query_texts=query_texts, n_results=n_results, where=where, **kwargs)
+
+        ids, documents, metadatas, vectors, sq_norms, index = self._snapshot()
+        queries = np.asarray(self._embed(query_texts), dtype=np.float32)
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": [], "embeddings": None}
+
+        if where:
+            rows = np.fromiter(
+                (i for i, meta in enumerate(metadatas) if self._matches(meta, where)), dtype=np.int64
+            )
+        else:
+            rows = None
+        k = min(n_results, len(ids) if rows is None else len(rows))
+
+        for q in queries:
+            if k <= 0:
+                hit_rows, hit_dists = [], []
+            elif rows is None and index is not None:
+                dists, hits = index.search(q[None, :], k)
+                hit_rows, hit_dists = hits[0].tolist(), dists[0].tolist()
+            else:
+                candidates = np.arange(len(ids)) if rows is None else rows
+                dists = sq_norms[candidates] - 2.0 * (vectors[candidates] @ q) + float(q @ q)
+                order = np.argpartition(dists, k - 1)[:k] if k < len(dists) else np.arange(len(dists))
+                order = order[np.argsort(dists[order])]
+                hit_rows, hit_dists = candidates[order].tolist(), dists[order].tolist()
+            result["ids"].append([ids[r] for r in hit_rows])
+            result["documents"].append([documents[r] for r in hit_rows])
+            result["metadatas"].append([metadatas[r] for r in hit_rows])
+            result["distances"].append([float(d) for d in hit_dists])
+        return result
+
 os.makedirs(chroma_db_path, exist_ok=True)
 chroma_client = None
 meetings_collection = None
@@ -537,19 +889,27 @@ if CHROMADB_AVAILABLE:
             chroma_client = chromadb.EphemeralClient()
             print("[KB] ChromaDB ephemeral client ready (data will not persist across restarts)")
 
-        chroma_client.list_collections()
-
-        print("[KB] Loading SentenceTransformer model (may download on first run)...")
-        embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        print("[KB] Embedding model loaded")
+        # On CPU prefer the INT8 ONNX model when optimum is installed
+        import torch
+        if not torch.cuda.is_available():
+            embedding_model = load_quantized_minilm(chroma_db_path.rstrip(os.sep) + "_models")
+        if embedding_model is not None:
+            print("[KB] Embedding model loaded (INT8 ONNX Runtime)")
+        else:
+            print("[KB] Loading SentenceTransformer model (may download on first run)...")
+            embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+            if embedding_model.device.type == "cuda":
+                embedding_model.half()
+            print(f"[KB] Embedding model loaded ({embedding_model.device})")
 
-        ef = embedding_functions.SentenceTransformerEmbeddingFunction(model_name="all-MiniLM-L6-v2")
+        ef = BatchedEmbeddingFunction(embedding_model)
         try:
             meetings_collection = chroma_client.get_collection(name="community_meetings", embedding_function=ef)
             print(f"[OK] ChromaDB collection loaded ({meetings_collection.count()} docs)")
         except:
             meetings_collection = chroma_client.create_collection(name="community_meetings", embedding_function=ef)
             print("[OK] ChromaDB collection created")
+        meetings_collection = InMemoryKBCollection(meetings_collection, ef)
     except Exception as e:
         import traceback
         print(f"[!] ChromaDB init failed: {e}")
@@ -564,37 +924,136 @@ else:
 # ============================================================================
 
 
+LIVE_SPILL_DIR = os.path.join(FILES_DIR, "live")
+
+def _append_jsonl(path, items):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(item) + "\n" for item in items))
+
+def _read_jsonl(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
 class LiveMeetingManager:
+    """Live meeting viewers and their transcript/highlight feed.
+
+    Viewers that connect with ?compress=zlib get binary frames: one marker
+    byte (0 = plain UTF-8 JSON, 1 = zlib-compressed JSON) and the body.
+    Everyone else gets the JSON as a text frame.
+    """
+
+    # Upper bound on concurrent socket writes during one broadcast
+    MAX_CONCURRENT_SENDS = 100
+    # Smaller payloads aren't worth compressing (zlib header + CPU)
+    COMPRESS_MIN_BYTES = 1024
+    # Keep at most this many recent items per meeting in memory; older ones
+    # are moved to a JSONL file in batches so long meetings stay bounded
+    MAX_BUFFERED_ITEMS = 5000
+    SPILL_BATCH = 1000
+
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.live_transcripts: Dict[str, List] = {}
-        self.live_highlights: Dict[str, List] = {}
+        self.active_connections: Dict[str, List[WebSocket]] = {}
+        self.live_transcripts: Dict[str, deque] = {}
+        self.live_highlights: Dict[str, deque] = {}
+        self._send_slots = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        self._spill_lock = asyncio.Lock()  # keeps spilled batches in order
+        self._zlib_viewers = set()
+
+    @staticmethod
+    def _spill_path(meeting_id: str, kind: str) -> str:
+        safe_id = re.sub(r"[^\w-]", "_", meeting_id)
+        return os.path.join(LIVE_SPILL_DIR, f"{safe_id}_{kind}.jsonl")
+
+    async def _buffer(self, buffers: Dict[str, deque], kind: str, meeting_id: str, item: dict):
+        buf = buffers[meeting_id]
+        buf.append(item)
+        if len(buf) > self.MAX_BUFFERED_ITEMS:
+            async with self._spill_lock:
+                if len(buf) > self.MAX_BUFFERED_ITEMS:
+                    spilled = [buf.popleft() for _ in range(self.SPILL_BATCH)]
+                    await asyncio.to_thread(_append_jsonl, self._spill_path(meeting_id, kind), spilled)
+
+    def get_full_transcript(self, meeting_id: str) -> List[dict]:
+        """Every transcript segment of the session: spilled ones first, then the buffer."""
+        return _read_jsonl(self._spill_path(meeting_id, "transcript")) + list(
+            self.live_transcripts.get(meeting_id, ())
+        )
+
+    def get_full_highlights(self, meeting_id: str) -> List[dict]:
+        return _read_jsonl(self._spill_path(meeting_id, "highlights")) + list(
+            self.live_highlights.get(meeting_id, ())
+        )
 
     async def connect(self, websocket: WebSocket, meeting_id: str):
         await websocket.accept()
-        self.active_connections[meeting_id] = websocket
-        self.live_transcripts[meeting_id] = []
-        self.live_highlights[meeting_id] = []
-        print(f" Live connection established for meeting: {meeting_id}")
-
-    async def disconnect(self, meeting_id: str):
-        if meeting_id in self.active_connections:
+        if meeting_id not in self.active_connections:
+            # First viewer starts a fresh session; later viewers join it
+            self.active_connections[meeting_id] = []
+            self.live_transcripts[meeting_id] = deque()
+            self.live_highlights[meeting_id] = deque()
+            for kind in ("transcript", "highlights"):
+                try:
+                    os.remove(self._spill_path(meeting_id, kind))
+                except FileNotFoundError:
+                    pass
+        self.active_connections[meeting_id].append(websocket)
+        if websocket.query_params.get("compress") == "zlib":
+            self._zlib_viewers.add(websocket)
+        print(f" Live connection established for meeting: {meeting_id} ({len(self.active_connections[meeting_id])} viewers)")
+
+    async def disconnect(self, meeting_id: str, websocket: Optional[WebSocket] = None):
+        """Drop one viewer, or every viewer of the meeting if websocket is None."""
+        conns = self.active_connections.get(meeting_id)
+        if conns is None:
+            return
+        if websocket is not None and websocket in conns:
+            conns.remove(websocket)
+            self._zlib_viewers.discard(websocket)
+        if websocket is None or not conns:
+            self._zlib_viewers.difference_update(conns)
             del self.active_connections[meeting_id]
             print(f" Live connection closed for meeting: {meeting_id}")
 
+    async def _send(self, websocket: WebSocket, message):
+        async with self._send_slots:
+            if isinstance(message, bytes):
+                await websocket.send_bytes(message)
+            else:
+                await websocket.send_text(message)
+
+    async def _broadcast(self, meeting_id: str, payload: dict):
+        """Send payload to every viewer at once; drop viewers whose send failed."""
+        conns = list(self.active_connections.get(meeting_id, ()))
+        # Serialize (and compress, if anyone asked for it) once for all viewers
+        message = dumps_compact(payload)
+        framed = None
+        if any(ws in self._zlib_viewers for ws in conns):
+            body = message.encode()
+            if len(body) >= self.COMPRESS_MIN_BYTES:
+                framed = b"\x01" + zlib.compress(body, 1)
+            else:
+                framed = b"\x00" + body
+        results = await asyncio.gather(
+            *(self._send(ws, framed if ws in self._zlib_viewers else message) for ws in conns),
+            return_exceptions=True,
+        )
+        for ws, result in zip(conns, results):
+            if isinstance(result, Exception):
+                await self.disconnect(meeting_id, ws)
+
     async def send_transcript_update(self, meeting_id: str, transcript_segment: dict):
         if meeting_id in self.active_connections:
-            await self.active_connections[meeting_id].send_json(
-                {"type": "transcript", "data": transcript_segment}
-            )
-            self.live_transcripts[meeting_id].append(transcript_segment)
+            await self._broadcast(meeting_id, {"type": "transcript", "data": transcript_segment})
+            await self._buffer(self.live_transcripts, "transcript", meeting_id, transcript_segment)
 
     async def send_highlight(self, meeting_id: str, highlight: dict):
         if meeting_id in self.active_connections:
-            await self.active_connections[meeting_id].send_json(
-                {"type": "highlight", "data": highlight}
-            )
-            self.live_highlights[meeting_id].append(highlight)
+            await self._broadcast(meeting_id, {"type": "highlight", "data": highlight})
+            await self._buffer(self.live_highlights, "highlights", meeting_id, highlight)
 
 
 live_manager = LiveMeetingManager()
@@ -604,76 +1063,82 @@ async def get_transcript_via_api(video_id):
     """Use YouTube's public timedtext API to fetch captions (works from cloud IPs)."""
     try:
         # Step 1: Get the video page to find caption track info
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            # Try the innertube API — works without cookies
-            innertube_url = "https://www.youtube.com/youtubei/v1/player"
-            payload = {
-                "context": {
-                    "client": {
-                        "hl": "en",
-                        "gl": "US",
-                        "clientName": "WEB",
-                        "clientVersion": "2.20240101.00.00"
-                    }
-                },
-                "videoId": video_id
-            }
-            resp = await client.post(innertube_url, json=payload, headers={"Content-Type": "application/json"})
-            if resp.status_code != 200:
-                print(f"   innertube API returned {resp.status_code}")
-                return None
-
-            data = resp.json()
-            captions = data.get("captions", {}).get("playerCaptionsTracklistRenderer", {}).get("captionTracks", [])
-
-            if not captions:
-                print(f"   No caption tracks found via innertube")
-                return None
-
-            # Find English caption track
-            caption_url = None
-            for track in captions:
-                lang = track.get("languageCode", "")
-                if lang.startswith("en"):
-                    caption_url = track.get("baseUrl", "")
-                    break
-            # Fallback: first available track
-            if not caption_url and captions:
-                caption_url = captions[0].get("baseUrl", "")
+        # (shared pooled client: keeps the youtube.com connection warm)
+        # Try the innertube API — works without cookies
+        innertube_url = "https://www.youtube.com/youtubei/v1/player"
+        payload = {
+            "context": {
+                "client": {
+                    "hl": "en",
+                    "gl": "US",
+                    "clientName": "WEB",
+                    "clientVersion": "2.20240101.00.00"
+                }
+            },
+            "videoId": video_id
+        }
+        resp = await HTTP_ASYNC.post(
+            innertube_url, json=payload, headers={"Content-Type": "application/json"},
+            timeout=15.0, follow_redirects=True,
+        )
+        if resp.status_code != 200:
+            print(f"   innertube API returned {resp.status_code}")
+            return None
 
-            if not caption_url:
-                return None
+        data = resp.json()
+        captions = data.get("captions", {}).get("playerCaptionsTracklistRenderer", {}).get("captionTracks", [])
 
-            # Append format parameter for VTT
-            if "fmt=" not in caption_url:
-                caption_url += "&fmt=vtt"
-            else:
-                caption_url = caption_url.replace("fmt=srv3", "fmt=vtt").replace("fmt=json3", "fmt=vtt")
+        if not captions:
+            print(f"   No caption tracks found via innertube")
+            return None
 
-            print(f"   Fetching captions from timedtext URL...")
-            caption_resp = await client.get(caption_url)
-            if caption_resp.status_code == 200 and caption_resp.text.strip().startswith("WEBVTT"):
-                print(f"   Got VTT via innertube API ({len(caption_resp.text)} chars)")
-                return caption_resp.text
+        # Find English caption track
+        caption_url = None
+        for track in captions:
+            lang = track.get("languageCode", "")
+            if lang.startswith("en"):
+                caption_url = track.get("baseUrl", "")
+                break
+        # Fallback: first available track
+        if not caption_url and captions:
+            caption_url = captions[0].get("baseUrl", "")
 
-            print(f"   Caption fetch failed: status={caption_resp.status_code}")
+        if not caption_url:
             return None
+
+        # Append format parameter for VTT
+        if "fmt=" not in caption_url:
+            caption_url += "&fmt=vtt"
+        else:
+            caption_url = caption_url.replace("fmt=srv3", "fmt=vtt").replace("fmt=json3", "fmt=vtt")
+
+        print(f"   Fetching captions from timedtext URL...")
+        caption_resp = await HTTP_ASYNC.get(caption_url, timeout=15.0, follow_redirects=True)
+        if caption_resp.status_code == 200 and caption_resp.text.strip().startswith("WEBVTT"):
+            print(f"   Got VTT via innertube API ({len(caption_resp.text)} chars)")
+            return caption_resp.text
+
+        print(f"   Caption fetch failed: status={caption_resp.status_code}")
+        return None
     except Exception as e:
         print(f"   innertube transcript error: {e}")
         return None
 
 
+# Leftover entities and >> markers in one alternation; the group that
+# matched picks the replacement (see _CLEAN_REPLACEMENTS)
+_RE_CLEAN = re.compile(r"(&gt;+|&lt;+|>>+)|(&amp;+)|(&nbsp;+)")
+_CLEAN_REPLACEMENTS = (None, "", "&", " ")
+_RE_WS = re.compile(r"\s+")
+
 def clean_text(text):
     """Clean HTML entities and >> symbols from text"""
     if not text:
         return text
     text = html.unescape(text)
-    text = re.sub(r"&gt;+", "", text)
-    text = re.sub(r"&lt;+", "", text)
-    text = re.sub(r"&amp;+", "&", text)
-    text = re.sub(r"&nbsp;+", " ", text)
-    text = re.sub(r">>+", "", text)
-    text = re.sub(r"\s+", " ", text)
+    if "&" in text or ">>" in text:
+        text = _RE_CLEAN.sub(lambda m: _CLEAN_REPLACEMENTS[m.lastindex], text)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
@@ -682,41 +1147,48 @@ def chunk_transcript_with_overlap(transcript, model="gpt-4o", strategy="balanced
     """
     SIMPLIFIED CHUNKING - Max 3-4 chunks to avoid rate limiting
     Fast and reliable approach
+
+    Returns (start, end) offsets into transcript rather than copies; the
+    text is sliced once, when the chunk's prompt is built.
     """
     transcript_length = len(transcript)
     print(f" Transcript length: {transcript_length:,} characters")
 
     # SIMPLE APPROACH: Never more than 4 chunks, each max ~40K chars
     if transcript_length <= 40000:  # Short - fits in one call
-        return [transcript], False
+        return [(0, transcript_length)], False
     elif transcript_length <= 80000:  # Medium
-        mid = transcript_length // 2
-        return [transcript[:mid], transcript[mid:]], True
+        parts = 2
     elif transcript_length <= 160000:  # Long
-        third = transcript_length // 3
-        return [
-            transcript[:third],
-            transcript[third : third * 2],
-            transcript[third * 2 :],
-        ], True
+        parts = 3
     else:  # Very long
-        quarter = transcript_length // 4
-        return [
-            transcript[:quarter],
-            transcript[quarter : quarter * 2],
-            transcript[quarter * 2 : quarter * 3],
-            transcript[quarter * 3 :],
-        ], True
+        parts = 4
+    size = transcript_length // parts
+    bounds = [i * size for i in range(parts)] + [transcript_length]
+    return list(zip(bounds, bounds[1:])), True
 
 
-def extract_key_points_from_chunk(chunk, chunk_num, total_chunks, model="gpt-4o"):
-    """Extract key points from a single chunk with minimal delay"""
+# Bump when the key-point prompts below change so old cached answers are ignored
+KEY_POINTS_PROMPT_VERSION = 1
+
+
+def extract_key_points_from_chunk(transcript, start, end, chunk_num, total_chunks, model="gpt-4o"):
+    """Extract key points from transcript[start:end]"""
     if not OPENAI_API_KEY:
         return None
+    chunk = transcript[start:min(end, start + 30000)]
 
-    # Small delay for later chunks to stagger parallel requests
-    if chunk_num > 2:
-        time.sleep(0.5)
+    # Same chunk text + model + prompt -> same answer; reuse it from the AI cache
+    import hashlib
+    chunk_hash = hashlib.blake2b(chunk.encode(), digest_size=16).hexdigest()
+    cache_params = {
+        "model": model,
+        "prompt_version": KEY_POINTS_PROMPT_VERSION,
+        "segment": [chunk_num, total_chunks],
+    }
+    cached = get_cached_result(chunk_hash, "chunk_key_points", cache_params)
+    if cached is not None:
+        return cached
 
     system_prompt = """You are an expert analyst specializing in civic and government meetings. 
 Your task is to extract the most important information from this segment of a meeting transcript."""
@@ -732,7 +1204,7 @@ Extract the following from THIS SEGMENT:
 Be specific. Include names, dates, and concrete details.
 
 SEGMENT {chunk_num}/{total_chunks}:
-{chunk[:30000]}
+{chunk}
 
 Respond in this JSON format:
 {{
@@ -756,10 +1228,27 @@ Respond in this JSON format:
         print(f"   Chunk {chunk_num} extraction returned None - AI call failed")
     else:
         print(f"   Chunk {chunk_num} extraction OK: {len(result)} chars")
+        save_to_cache(chunk_hash, "chunk_key_points", result, cache_params)
 
     return result
 
 
+def dedupe_key_points(items):
+    """Drop repeats that differ only in case/whitespace; first spelling wins."""
+    seen = set()
+    out = []
+    for item in items:
+        if isinstance(item, str):
+            key = _RE_WS.sub(" ", item).strip().lower()
+        else:
+            # The model occasionally returns objects instead of strings
+            key = json.dumps(item, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
 def synthesize_full_meeting(all_key_points, model="gpt-4o", strategy="concise", reel_style=None):
     """Synthesize all extracted key points into final summary"""
     if not OPENAI_API_KEY or not all_key_points:
@@ -771,22 +1260,31 @@ def synthesize_full_meeting(all_key_points, model="gpt-4o", strategy="concise",
     combined_actions = []
     combined_quotes = []
 
+    targets = (
+        ("decisions", combined_decisions),
+        ("discussions", combined_discussions),
+        ("action_items", combined_actions),
+        ("notable_quotes", combined_quotes),
+    )
     for kp in all_key_points:
-        if kp:
-            try:
-                data = json.loads(kp)
-                combined_decisions.extend(data.get("decisions", []))
-                combined_discussions.extend(data.get("discussions", []))
-                combined_actions.extend(data.get("action_items", []))
-                combined_quotes.extend(data.get("notable_quotes", []))
-            except:
-                continue
+        if not kp:
+            continue
+        try:
+            data = loads_json(kp)  # orjson's JSONDecodeError is a ValueError too
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        for field, combined in targets:
+            items = data.get(field)
+            if isinstance(items, list):
+                combined.extend(items)
 
-    # FIXED: Use dict.fromkeys to remove duplicates while preserving order
-    combined_decisions = list(dict.fromkeys(combined_decisions))
-    combined_discussions = list(dict.fromkeys(combined_discussions))
-    combined_actions = list(dict.fromkeys(combined_actions))
-    combined_quotes = list(dict.fromkeys(combined_quotes))
+    # Remove duplicates across chunks while preserving order
+    combined_decisions = dedupe_key_points(combined_decisions)
+    combined_discussions = dedupe_key_points(combined_discussions)
+    combined_actions = dedupe_key_points(combined_actions)
+    combined_quotes = dedupe_key_points(combined_quotes)
 
     if strategy == "highlights_with_quotes":
         # Check for reel style override from optimized_prompts
@@ -1123,7 +1621,7 @@ def call_openai_api(
                 if response_format == "json_object":
                     data["response_format"] = {"type": "json_object"}
 
-                response = httpx.post(
+                response = HTTP_CLIENT.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers=headers,
                     json=data,
@@ -1131,7 +1629,8 @@ def call_openai_api(
                 )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    # Parse the raw body bytes directly (no str decode step)
+                    result = loads_json(response.content)
                     content = result["choices"][0]["message"]["content"]
                     
                     # Log token usage for cost monitoring
@@ -1186,6 +1685,30 @@ def call_openai_api(
     return None
 
 
+# Blocking AI calls run on their own pool: it caps requests in flight to the
+# provider (rate limits), and seconds-long calls can't fill up the default
+# executor that asyncio.to_thread shares with parsing/file work
+OPENAI_CONCURRENCY = int(os.environ.get("OPENAI_CONCURRENCY", "8"))
+_AI_CALL_POOL = ThreadPoolExecutor(max_workers=OPENAI_CONCURRENCY, thread_name_prefix="ai-call")
+
+
+async def run_ai_call(func, *args, **kwargs):
+    """Run a blocking function that talks to the AI provider on the AI pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_AI_CALL_POOL, partial(func, *args, **kwargs))
+
+
+async def call_ai_api_async(*args, **kwargs):
+    """call_ai_api for async handlers: runs the blocking request in a worker
+    thread so other requests and WebSocket broadcasts keep being served."""
+    return await run_ai_call(call_ai_api, *args, **kwargs)
+
+
+async def call_openai_api_async(*args, **kwargs):
+    """call_openai_api for async handlers (see call_ai_api_async)."""
+    return await run_ai_call(call_openai_api, *args, **kwargs)
+
+
 def call_openai_api_stream(prompt, max_tokens=2000, model="gpt-4o", temperature=0.3, system_prompt=None):
     """Streaming version of call_openai_api. Yields text chunks."""
     if not OPENAI_API_KEY:
@@ -1209,24 +1732,23 @@ def call_openai_api_stream(prompt, max_tokens=2000, model="gpt-4o", temperature=
 
     headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
     try:
-        with httpx.Client(timeout=180.0) as client:
-            with client.stream("POST", "https://api.openai.com/v1/chat/completions", headers=headers, json=data) as resp:
-                if resp.status_code != 200:
-                    print(f"[OpenAI Stream] Error {resp.status_code}")
-                    return
-                for line in resp.iter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    payload = line[6:]
-                    if payload.strip() == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(payload)
-                        delta = chunk.get("choices", [{}])[0].get("delta", {}).get("content", "")
-                        if delta:
-                            yield delta
-                    except json.JSONDecodeError:
-                        continue
+        with HTTP_CLIENT.stream("POST", "https://api.openai.com/v1/chat/completions", headers=headers, json=data, timeout=180.0) as resp:
+            if resp.status_code != 200:
+                print(f"[OpenAI Stream] Error {resp.status_code}")
+                return
+            for line in resp.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                payload = line[6:]
+                if payload.strip() == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(payload)
+                    delta = chunk.get("choices", [{}])[0].get("delta", {}).get("content", "")
+                    if delta:
+                        yield delta
+                except json.JSONDecodeError:
+                    continue
     except Exception as e:
         print(f"[OpenAI Stream] Exception: {e}")
 
@@ -1273,6 +1795,12 @@ def call_ai_api_stream(prompt, max_tokens=2000, model="gpt-4o", temperature=0.3,
         yield from call_openai_api_stream(prompt, max_tokens, model, temperature, system_prompt)
 
 
+# Vote and discussion words in one scan; lastgroup says which bucket matched
+_ACTIVITY_RE = re.compile(
+    r'\b(?:(?P<vote>vote[ds]?|motion|approve[ds]?|pass(?:ed)?|unanimous)'
+    r'|(?P<discussion>discuss(?:ed|ion)?|consider(?:ed)?|review(?:ed)?|present(?:ed|ation)?))\b'
+)
+
 def generate_fallback_summary(transcript):
     """Generate a sensible generic summary when AI is unavailable.
     NEVER includes raw transcript text to avoid nonsensical output."""
@@ -1300,8 +1828,9 @@ def generate_fallback_summary(transcript):
         meeting_type = "Town Meeting"
     
     # Count key activities
-    vote_count = len(re.findall(r'\b(vote[ds]?|motion|approve[ds]?|pass(?:ed)?|unanimous)\b', transcript_lower))
-    discussion_count = len(re.findall(r'\b(discuss(?:ed|ion)?|consider(?:ed)?|review(?:ed)?|present(?:ed|ation)?)\b', transcript_lower))
+    activity = Counter(m.lastgroup for m in _ACTIVITY_RE.finditer(transcript_lower))
+    vote_count = activity["vote"]
+    discussion_count = activity["discussion"]
     public_comment = 'public comment' in transcript_lower or 'resident' in transcript_lower
     
     # Build a clean, generic summary
@@ -1396,54 +1925,61 @@ def generate_fallback_highlights(transcript):
     return highlights[:10]
 
 
+# Two adjacent whitespace-separated tokens that look like a capitalized name:
+# the first may only have leading punctuation, the second only trailing, so
+# "Smith. Council" across a sentence break doesn't count. The lookahead lets
+# every word pair in the text match (they overlap). [^\W\d_a-z] skips the
+# common lowercase/digit starts in C; isupper() settles non-ASCII letters.
+_CAP_BIGRAM_RE = re.compile(
+    r"(?<!\S)[^\w\s-]*([^\W\d_a-z][\w-]+)(?=\s+([^\W\d_a-z][\w-]+)[^\w\s-]*(?!\S))"
+)
+
 def generate_fallback_entities(transcript):
     """v5.2: STRICT fallback - only full names and proper nouns"""
-    entities = []
-    words = transcript.split()
-    seen = set()
-    
     # Skip common words that aren't entities
     skip_words = {"the", "this", "that", "there", "they", "thank", "thanks", "and", "but", 
                   "what", "when", "where", "why", "how", "will", "would", "could", "should",
                   "have", "has", "had", "been", "being", "are", "was", "were", "is", "it"}
-    
-    for i in range(len(words) - 1):
-        word1 = re.sub(r"[^\w\s-]", "", words[i]).strip()
-        word2 = re.sub(r"[^\w\s-]", "", words[i + 1]).strip()
-        
-        # Must have two capitalized words (full name pattern)
-        if (word1 and word2 and len(word1) > 1 and len(word2) > 1 and
-            word1[0].isupper() and word2[0].isupper() and
+    place_words = ["Street", "Road", "Avenue", "Park", "Building", "Center", 
+                   "City", "County", "State", "Drive", "Boulevard", "Lane"]
+    org_words = ["Department", "Board", "Committee", "Council", "Commission", 
+                 "Office", "Agency", "Corporation", "Company", "Association"]
+    
+    # One regex scan for capitalized word pairs; each name keeps the spelling
+    # it was first seen with and counts its occurrences as we go
+    names = {}
+    counts = Counter()
+    for m in _CAP_BIGRAM_RE.finditer(transcript):
+        word1, word2 = m.groups()
+        if (word1[0].isupper() and word2[0].isupper() and
             word1.lower() not in skip_words and word2.lower() not in skip_words):
-            
-            full_name = f"{word1} {word2}"
-            key = full_name.lower()
-            
-            if key not in seen:
-                seen.add(key)
-                
-                # Determine type based on keywords
-                entity_type = "PERSON"
-                place_words = ["Street", "Road", "Avenue", "Park", "Building", "Center", 
-                              "City", "County", "State", "Drive", "Boulevard", "Lane"]
-                org_words = ["Department", "Board", "Committee", "Council", "Commission", 
-                            "Office", "Agency", "Corporation", "Company", "Association"]
-                
-                if any(t in full_name for t in place_words):
-                    entity_type = "PLACE"
-                elif any(t in full_name for t in org_words):
-                    entity_type = "ORG"
-                
-                # Count occurrences
-                count = transcript.lower().count(full_name.lower())
-                if count >= 1:
-                    entities.append({"text": full_name, "count": max(count, 1), "type": entity_type})
+            key = f"{word1} {word2}".lower()
+            names.setdefault(key, f"{word1} {word2}")
+            counts[key] += 1
+    
+    entities = []
+    for key, full_name in names.items():
+        # Determine type based on keywords
+        entity_type = "PERSON"
+        if any(t in full_name for t in place_words):
+            entity_type = "PLACE"
+        elif any(t in full_name for t in org_words):
+            entity_type = "ORG"
+        entities.append({"text": full_name, "count": counts[key], "type": entity_type})
     
     # Sort by count and return top 30 (quality over quantity)
     entities.sort(key=lambda x: x["count"], reverse=True)
     return entities[:30]
 
 
+def _vtt_time(seconds):
+    """HH:MM:SS.mmm, split in integer milliseconds (no float modulo)."""
+    hours, rem = divmod(int(seconds * 1000), 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
 def to_vtt(transcript_list):
     """Convert transcript to VTT format"""
     out = ["WEBVTT", ""]
@@ -1452,22 +1988,22 @@ def to_vtt(transcript_list):
         duration = float(item.get("duration", 0))
         end = start + duration
 
-        def format_time(seconds):
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            millis = int((seconds % 1) * 1000)
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
-
         text = clean_text(item.get("text", "").strip())
         if text:
-            out.append(f"{format_time(start)} --> {format_time(end)}")
+            out.append(f"{_vtt_time(start)} --> {_vtt_time(end)}")
             out.append(text)
             out.append("")
 
     return "\n".join(out)
 
 
+_YT_ID_PATTERNS = [
+    re.compile(r"(?:v=|\/)([0-9A-Za-z_-]{11}).*"),
+    re.compile(r"(?:embed\/)([0-9A-Za-z_-]{11})"),
+    re.compile(r"(?:watch\?v=)([0-9A-Za-z_-]{11})"),
+    re.compile(r"youtu\.be\/([0-9A-Za-z_-]{11})"),
+]
+
 def get_video_id(url):
     """Extract video ID from various YouTube URL formats"""
     if not url:
@@ -1476,15 +2012,12 @@ def get_video_id(url):
     if len(url) == 11 and url.isalnum():
         return url
 
-    patterns = [
-        r"(?:v=|\/)([0-9A-Za-z_-]{11}).*",
-        r"(?:embed\/)([0-9A-Za-z_-]{11})",
-        r"(?:watch\?v=)([0-9A-Za-z_-]{11})",
-        r"youtu\.be\/([0-9A-Za-z_-]{11})",
-    ]
+    return _video_id_from_url(url)
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
+@lru_cache(maxsize=4096)
+def _video_id_from_url(url):
+    for pattern in _YT_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
 
@@ -1671,6 +2204,97 @@ async def system_status():
 
 
 
+# One cue: a timing line (any line with "-->", except the WEBVTT header and
+# NOTE lines) followed by its text lines, up to the next blank or timing line
+_VTT_CUE_RE = re.compile(
+    r"^(?![^\S\n]*(?:WEBVTT|NOTE))([^\n]*-->[^\n]*)"
+    r"((?:\n(?![^\S\n]*(?:\n|\Z))(?![^\n]*-->)[^\n]*)*)",
+    re.MULTILINE,
+)
+_VTT_TAG_RE = re.compile(r"<[^>\n]+>")
+_VTT_STYLE_RE = re.compile(r"\{[^}\n]+\}")
+
+
+# Each cue usually starts where the previous one ended, so about half the
+# timestamps in a YouTube VTT file are repeats
+@lru_cache(maxsize=4096)
+def _vtt_timestamp_seconds(time_str):
+    """'HH:MM:SS.mmm' (or MM:SS / SS, comma decimals ok) -> seconds."""
+    # Remove any position or alignment info
+    time_str = time_str.split()[0].replace(",", ".")
+    parts = time_str.split(":")
+    if len(parts) == 3:
+        h, m, s = parts
+        return float(h) * 3600 + float(m) * 60 + float(s)
+    elif len(parts) == 2:
+        m, s = parts
+        return float(m) * 60 + float(s)
+    else:
+        return float(parts[0])
+
+
+def _z_array(words):
+    """z[k] = how many words starting at k match the start of the list."""
+    n = len(words)
+    z = [0] * n
+    left = right = 0
+    for k in range(1, n):
+        if k < right:
+            z[k] = min(right - k, z[k - left])
+        while k + z[k] < n and words[z[k]] == words[k + z[k]]:
+            z[k] += 1
+        if k + z[k] > right:
+            left, right = k, k + z[k]
+    return z
+
+
+def remove_internal_repetition(text):
+    """Detect and remove repeated phrases within text.
+    
+    Example: "hello world hello world" -> "hello world"
+    """
+    if not text or len(text) < 10:
+        return text
+    
+    # Normalize whitespace
+    words = text.split()
+    n = len(words)
+    if n < 4:
+        return ' '.join(words)
+    
+    # Compare word lists, not re-joined strings; only the result is joined
+    # Try splitting in half first (most common case: exact 2x repeat)
+    half = n // 2
+    if words[:half] == words[half:half*2]:
+        return ' '.join(words[:half])
+    
+    # Try splitting in thirds (3x repeat)
+    third = n // 3
+    if third >= 2 and words[:third] == words[third:third*2] == words[third*2:third*3]:
+        return ' '.join(words[:third])
+    
+    # Try to find where the text starts repeating by looking for first word
+    # appearing again. z[i] tells in O(1) how far words[i:] repeats the
+    # opening, so the scan is linear instead of a join + compare per candidate.
+    first_word = words[0].lower()
+    z = None
+    for i in range(2, min(half + 2, n)):
+        if words[i].lower() != first_word:
+            continue
+        if z is None:
+            z = _z_array(words)
+        rest_len = n - i
+        # rest == candidate, or rest starts with the whole candidate
+        if z[i] >= min(i, rest_len):
+            return ' '.join(words[:i])
+        # rest is a prefix of candidate, cut off mid-word at the end
+        if (rest_len <= i and z[i] == rest_len - 1
+                and words[rest_len - 1].startswith(words[-1])):
+            return ' '.join(words[:i])
+    
+    return ' '.join(words)
+
+
 def parse_vtt_to_transcript(vtt_content: str) -> list:
     """Parse VTT content into transcript format for AI assistant
     
@@ -1678,160 +2302,77 @@ def parse_vtt_to_transcript(vtt_content: str) -> list:
     Also detects and removes internal repetition within a single caption.
     """
     transcript_data = []
-    lines = vtt_content.split("\n")
-    i = 0
     
-    # Track seen text to avoid duplicates
+    # Track seen text to avoid duplicates. The previous caption's normalized
+    # text and word set are kept alongside it so each caption is lowered and
+    # split once, not again on every comparison.
     seen_texts = set()
     last_text = ""
+    last_normalized = ""
+    last_words = None
     
-    def remove_internal_repetition(text):
-        """Detect and remove repeated phrases within text.
-        
-        Example: "hello world hello world" -> "hello world"
-        """
-        if not text or len(text) < 10:
-            return text
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
-            
-        words = text.split(' ')
-        n = len(words)
-        if n < 4:
-            return text
-        
-        # Try splitting in half first (most common case: exact 2x repeat)
-        half = n // 2
-        first_half = ' '.join(words[:half])
-        second_half = ' '.join(words[half:half*2])
-        if first_half == second_half:
-            return first_half
-        
-        # Try splitting in thirds (3x repeat)
-        third = n // 3
-        if third >= 2:
-            p1 = ' '.join(words[:third])
-            p2 = ' '.join(words[third:third*2])
-            p3 = ' '.join(words[third*2:third*3])
-            if p1 == p2 == p3:
-                return p1
-        
-        # Try to find where the text starts repeating by looking for first word appearing again
-        first_word = words[0].lower()
-        for i in range(2, half + 2):
-            if i < n and words[i].lower() == first_word:
-                # Potential repeat starting at position i
-                candidate = ' '.join(words[:i])
-                rest = ' '.join(words[i:])
-                # Check if rest starts with candidate (allowing partial at end)
-                if rest == candidate or rest.startswith(candidate + ' ') or candidate.startswith(rest):
-                    return candidate
-        
-        return text
+    for cue in _VTT_CUE_RE.finditer(vtt_content):
+        try:
+            timestamp_parts = cue.group(1).strip().split("-->")
+            start_seconds = _vtt_timestamp_seconds(timestamp_parts[0].strip())
+            end_seconds = _vtt_timestamp_seconds(timestamp_parts[1].strip())
+            duration = max(end_seconds - start_seconds, 0.5)
 
-    while i < len(lines):
-        line = lines[i].strip()
+            # Strip each text line, then remove VTT tags/style info from the
+            # whole block at once (the patterns stop at line breaks)
+            block = "\n".join(line.strip() for line in cue.group(2).split("\n")[1:])
+            block = _VTT_STYLE_RE.sub("", _VTT_TAG_RE.sub("", block))
+            text = block.replace("\n", " ").strip()
 
-        # Skip WEBVTT header and empty lines
-        if not line or line.startswith("WEBVTT") or line.startswith("NOTE"):
-            i += 1
-            continue
+            if text:
+                # FIRST: Remove internal repetition (e.g., "hello hello hello" -> "hello")
+                text = remove_internal_repetition(text)
 
-        # Look for timestamp lines (HH:MM:SS.mmm --> HH:MM:SS.mmm)
-        if "-->" in line:
-            try:
-                timestamp_parts = line.split("-->")
-                start_time = timestamp_parts[0].strip()
-                end_time = (
-                    timestamp_parts[1].strip()
-                    if len(timestamp_parts) > 1
-                    else start_time
-                )
+                # Deduplicate: Check for exact duplicates and rolling text
+                text_normalized = text.lower().strip()
 
-                # Convert timestamp to seconds
-                def time_to_seconds(time_str):
-                    # Remove any position or alignment info
-                    time_str = time_str.split()[0].replace(",", ".")
-                    parts = time_str.split(":")
-                    if len(parts) == 3:
-                        h, m, s = parts
-                        return float(h) * 3600 + float(m) * 60 + float(s)
-                    elif len(parts) == 2:
-                        m, s = parts
-                        return float(m) * 60 + float(s)
-                    else:
-                        return float(parts[0])
-
-                start_seconds = time_to_seconds(start_time)
-                end_seconds = time_to_seconds(end_time)
-                duration = max(end_seconds - start_seconds, 0.5)
-
-                # Get the text (next non-empty lines)
-                i += 1
-                text_lines = []
-                while i < len(lines):
-                    text_line = lines[i].strip()
-                    if not text_line or "-->" in text_line:
-                        break
-                    # Remove VTT formatting tags
-                    text_line = re.sub(r"<[^>]+>", "", text_line)  # Remove all tags
-                    text_line = re.sub(r"\{[^}]+\}", "", text_line)  # Remove style info
-                    text_lines.append(text_line)
-                    i += 1
+                # Skip if exact duplicate
+                if text_normalized in seen_texts:
+                    continue
 
-                text = " ".join(text_lines).strip()
-                
-                if text:
-                    # FIRST: Remove internal repetition (e.g., "hello hello hello" -> "hello")
-                    text = remove_internal_repetition(text)
-                    
-                    # Deduplicate: Check for exact duplicates and rolling text
-                    text_normalized = text.lower().strip()
-                    
-                    # Skip if exact duplicate
-                    if text_normalized in seen_texts:
-                        continue
-                    
-                    # Check for rolling/overlapping text (YouTube captions often show partial updates)
-                    # If new text is contained in last text, or last text is contained in new text, skip
-                    is_rolling = False
-                    if last_text:
-                        last_normalized = last_text.lower().strip()
-                        # Check if one contains the other (rolling caption)
-                        if text_normalized in last_normalized or last_normalized in text_normalized:
-                            # Keep the longer one
-                            if len(text_normalized) > len(last_normalized):
-                                # Replace last entry with this longer one
-                                if transcript_data:
+                # Check for rolling/overlapping text (YouTube captions often show partial updates)
+                # If new text is contained in last text, or last text is contained in new text, skip
+                is_rolling = False
+                words_new = None  # built only if the overlap check needs it
+                if last_text:
+                    # Check if one contains the other (rolling caption)
+                    if text_normalized in last_normalized or last_normalized in text_normalized:
+                        # Keep the longer one
+                        if len(text_normalized) > len(last_normalized):
+                            # Replace last entry with this longer one
+                            if transcript_data:
+                                transcript_data[-1]["text"] = text
+                                seen_texts.add(text_normalized)
+                                last_text, last_normalized, last_words = text, text_normalized, None
+                        is_rolling = True
+                    # Check for significant overlap (more than 70% of words match)
+                    else:
+                        words_new = set(text_normalized.split())
+                        if last_words is None:
+                            last_words = set(last_normalized.split())
+                        if words_new and last_words:
+                            overlap = len(words_new & last_words) / min(len(words_new), len(last_words))
+                            if overlap > 0.7:  # 70% overlap = likely rolling caption
+                                # Keep the longer text
+                                if len(text) > len(last_text) and transcript_data:
                                     transcript_data[-1]["text"] = text
-                                    seen_texts.add(text_normalized)
-                                    last_text = text
-                            is_rolling = True
-                        # Check for significant overlap (more than 50% of words match)
-                        elif not is_rolling:
-                            words_new = set(text_normalized.split())
-                            words_last = set(last_normalized.split())
-                            if words_new and words_last:
-                                overlap = len(words_new & words_last) / min(len(words_new), len(words_last))
-                                if overlap > 0.7:  # 70% overlap = likely rolling caption
-                                    # Keep the longer text
-                                    if len(text) > len(last_text) and transcript_data:
-                                        transcript_data[-1]["text"] = text
-                                        last_text = text
-                                    is_rolling = True
-                    
-                    if not is_rolling:
-                        seen_texts.add(text_normalized)
-                        transcript_data.append(
-                            {"text": text, "start": start_seconds, "duration": duration}
-                        )
-                        last_text = text
-                        
-            except Exception as e:
-                print(f"   Warning: Could not parse timestamp: {e}")
+                                    last_text, last_normalized, last_words = text, text_normalized, words_new
+                                is_rolling = True
 
-        i += 1
+                if not is_rolling:
+                    seen_texts.add(text_normalized)
+                    transcript_data.append(
+                        {"text": text, "start": start_seconds, "duration": duration}
+                    )
+                    last_text, last_normalized, last_words = text, text_normalized, words_new
+
+        except Exception as e:
+            print(f"   Warning: Could not parse timestamp: {e}")
 
     print(f"   Parsed {len(transcript_data)} segments from VTT (deduplicated)")
     return transcript_data
@@ -1903,7 +2444,7 @@ async def get_transcript(req: Request):
 
                 # Try to parse and store
                 try:
-                    transcript_data = parse_vtt_to_transcript(vtt)
+                    transcript_data = await asyncio.to_thread(parse_vtt_to_transcript, vtt)
                     if transcript_data:
                         STORED_TRANSCRIPTS[video_id] = transcript_data
                         print(
@@ -1932,6 +2473,7 @@ async def get_transcript(req: Request):
             ydl_opts["proxy"] = WEBSHARE_PROXY_URL
             print("   Using Webshare proxy for yt-dlp")
 
+        yt_dlp = await load_yt_dlp()
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(
                 f"https://www.youtube.com/watch?v={video_id}", download=False
@@ -1950,38 +2492,38 @@ async def get_transcript(req: Request):
                             break
 
                     if vtt_url:
-                        # Create httpx client, with proxy if available
-                        client_kwargs = {}
+                        # Through the proxy if one is configured, else the shared pooled client
                         if WEBSHARE_PROXY_URL:
-                            client_kwargs["proxies"] = {"http://": WEBSHARE_PROXY_URL, "https://": WEBSHARE_PROXY_URL}
-                        
-                        async with httpx.AsyncClient(**client_kwargs) as client:
-                            resp = await client.get(vtt_url)
-                            if resp.status_code == 200:
-                                vtt_content = resp.text
-                                print(f"  Got VTT via yt-dlp")
-
-                                #  CRITICAL: Parse and store for AI assistant
-                                try:
-                                    transcript_data = parse_vtt_to_transcript(
-                                        vtt_content
-                                    )
-                                    if transcript_data:
-                                        STORED_TRANSCRIPTS[video_id] = transcript_data
-                                        print(
-                                            f" STORED {len(transcript_data)} segments (Method: yt-dlp)"
-                                        )
-                                    else:
-                                        print(f"Ãƒâ€šÃ‚Â   VTT parsing returned no data")
-                                except Exception as parse_error:
+                            proxies = {"http://": WEBSHARE_PROXY_URL, "https://": WEBSHARE_PROXY_URL}
+                            async with httpx.AsyncClient(proxies=proxies) as client:
+                                resp = await client.get(vtt_url)
+                        else:
+                            resp = await HTTP_ASYNC.get(vtt_url)
+                        if resp.status_code == 200:
+                            vtt_content = resp.text
+                            print(f"  Got VTT via yt-dlp")
+
+                            #  CRITICAL: Parse and store for AI assistant
+                            try:
+                                transcript_data = await asyncio.to_thread(
+                                    parse_vtt_to_transcript, vtt_content
+                                )
+                                if transcript_data:
+                                    STORED_TRANSCRIPTS[video_id] = transcript_data
                                     print(
-                                        f"Ãƒâ€šÃ‚Â   Could not parse yt-dlp VTT: {parse_error}"
+                                        f" STORED {len(transcript_data)} segments (Method: yt-dlp)"
                                     )
-
-                                return Response(
-                                    content=vtt_content, media_type="text/vtt"
+                                else:
+                                    print(f"Ãƒâ€šÃ‚Â   VTT parsing returned no data")
+                            except Exception as parse_error:
+                                print(
+                                    f"Ãƒâ€šÃ‚Â   Could not parse yt-dlp VTT: {parse_error}"
                                 )
 
+                            return Response(
+                                content=vtt_content, media_type="text/vtt"
+                            )
+
     except Exception as e:
         print(f"Ãƒâ€šÃ‚Â   yt-dlp failed: {e}")
 
@@ -2008,7 +2550,7 @@ async def upload_transcript(video_id: str = Form(...), file: UploadFile = File(.
 
     if filename.endswith(".vtt"):
         # Parse VTT
-        transcript_data = parse_vtt_to_transcript(text)
+        transcript_data = await asyncio.to_thread(parse_vtt_to_transcript, text)
     elif filename.endswith(".srt"):
         # Parse SRT: "index\n00:00:01,000 --> 00:00:05,000\nText\n\n"
         blocks = re.split(r'\n\s*\n', text.strip())
@@ -2094,85 +2636,102 @@ async def api_cache_cleanup(req: Request):
     return result
 
 
+# Words that dominate civic meeting transcripts without saying anything about
+# the content; filtered from /api/wordfreq on top of NLTK's English list
+_WORDFREQ_CIVIC_STOPWORDS = frozenset({
+    # Basic grammar words
+    "the", "and", "for", "with", "that", "this", "from", "into", "your", "about",
+    "have", "will", "they", "them", "were", "has", "had", "not", "but", "are",
+    "our", "you", "its", "it's", "we're", "there", "here", "been", "was", "who",
+    "what", "when", "where", "how", "why", "which", "than", "then", "both",
+    "each", "other", "more", "some", "any", "all", "most", "own", "same",
+    "such", "only", "over", "after", "before", "between", "through", "under",
+    # Politeness & speech acts (dominate civic meeting transcripts)
+    "thank", "thanks", "thanking", "thanked", "please", "okay", "yes", "yeah",
+    "right", "sure", "well", "just", "like", "really", "actually", "absolutely",
+    "certainly", "definitely", "exactly", "great", "good", "nice", "wonderful",
+    # Common filler verbs in speech
+    "going", "think", "know", "want", "need", "believe", "feel", "mean",
+    "understand", "hope", "talking", "saying", "looking", "coming", "making",
+    "getting", "doing", "being", "having", "using", "working", "trying",
+    "asking", "speaking", "hearing", "moving", "calling", "bringing",
+    # Modal/auxiliary verbs
+    "would", "could", "should", "shall", "might", "also", "very", "much",
+    "can", "may", "must", "does", "did",
+    # Generic nouns/pronouns in speech
+    "thing", "things", "something", "anything", "everything", "someone",
+    "everyone", "people", "person", "way", "ways", "time", "times",
+    "today", "tonight", "year", "years", "day", "days", "week", "weeks",
+    "month", "months", "number", "part", "point", "fact", "case", "end",
+    "work", "place", "state", "area", "issue", "issues", "matter",
+    # Common speech fillers & generic words
+    "gonna", "gotta", "kinda", "sorta", "kind", "sort", "lot", "lots", "bit",
+    "many", "every", "even", "still", "already", "always", "never", "often",
+    "first", "last", "next", "new", "long", "different", "important",
+    "able", "enough", "ago", "away", "around", "across",
+    # Generic action verbs
+    "look", "come", "came", "back", "make", "made", "take", "took",
+    "get", "got", "say", "said", "tell", "told", "let", "put",
+    "give", "gave", "see", "saw", "one", "two", "three", "keep",
+    "call", "called", "ask", "asked", "move", "moved", "bring", "brought",
+    "set", "start", "started", "continue", "continued", "support",
+    "present", "presented", "pass", "passed",
+    # Titles used in address (not meaningful as standalone words)
+    "mr", "mrs", "ms", "dr",
+    # Meeting-specific filler (not policy content)
+    "speaker", "colleagues", "colleague", "members", "member",
+    "majority", "leader", "intro", "introduction",
+    # Civic meeting title words (said frequently but not meaningful content)
+    "select", "board", "selectboard", "committee", "council",
+    "city", "town", "village", "county", "borough",
+    "meeting", "session", "hearing", "agenda",
+    "planning", "zoning", "school", "finance", "budget",
+    "commission", "authority", "department", "office",
+    "public", "regular", "special", "annual", "monthly", "weekly",
+    "minutes", "motion", "second", "vote", "aye", "nay",
+    "resolution", "ordinance", "amendment", "warrant",
+    "stated", "live", "watch", "recording", "video",
+})
+_WORDFREQ_TOKEN_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+_wordfreq_stopwords = None
+
+
+def get_wordfreq_stopwords():
+    """NLTK's English stopwords plus the civic list, merged once."""
+    global _wordfreq_stopwords
+    if _wordfreq_stopwords is None:
+        english = get_english_stopwords()
+        if not english:
+            # NLTK data unavailable right now; try again on the next request
+            return _WORDFREQ_CIVIC_STOPWORDS
+        _wordfreq_stopwords = english | _WORDFREQ_CIVIC_STOPWORDS
+    return _wordfreq_stopwords
+
+
+def _count_words(raw_transcript):
+    """Content-word counts for /api/wordfreq."""
+    transcript = clean_text(raw_transcript)
+    # Count every token in C, then drop stopwords once per distinct word
+    # instead of testing each token in a Python generator
+    word_counts = Counter(_WORDFREQ_TOKEN_RE.findall(transcript.lower()))
+    for word in word_counts.keys() & get_wordfreq_stopwords():
+        del word_counts[word]
+    return word_counts
+
+
 @app.post("/api/wordfreq")
 async def wordfreq(req: Request):
     data = await req.json()
-    transcript = clean_text(data.get("transcript", ""))
-
-    if not transcript:
+    # Cleaning and counting a long transcript takes tens of ms; keep it off
+    # the event loop
+    word_counts = await asyncio.to_thread(_count_words, data.get("transcript", ""))
+    if not word_counts:
         return {"words": []}
 
-    try:
-        stop_words = set(stopwords.words("english"))
-    except:
-        try:
-            nltk.download("stopwords", quiet=True)
-            stop_words = set(stopwords.words("english"))
-        except:
-            stop_words = set()
-
-    civic_stopwords = {
-        # Basic grammar words
-        "the", "and", "for", "with", "that", "this", "from", "into", "your", "about",
-        "have", "will", "they", "them", "were", "has", "had", "not", "but", "are",
-        "our", "you", "its", "it's", "we're", "there", "here", "been", "was", "who",
-        "what", "when", "where", "how", "why", "which", "than", "then", "both",
-        "each", "other", "more", "some", "any", "all", "most", "own", "same",
-        "such", "only", "over", "after", "before", "between", "through", "under",
-        # Politeness & speech acts (dominate civic meeting transcripts)
-        "thank", "thanks", "thanking", "thanked", "please", "okay", "yes", "yeah",
-        "right", "sure", "well", "just", "like", "really", "actually", "absolutely",
-        "certainly", "definitely", "exactly", "great", "good", "nice", "wonderful",
-        # Common filler verbs in speech
-        "going", "think", "know", "want", "need", "believe", "feel", "mean",
-        "understand", "hope", "talking", "saying", "looking", "coming", "making",
-        "getting", "doing", "being", "having", "using", "working", "trying",
-        "asking", "speaking", "hearing", "moving", "calling", "bringing",
-        # Modal/auxiliary verbs
-        "would", "could", "should", "shall", "might", "also", "very", "much",
-        "can", "may", "must", "does", "did",
-        # Generic nouns/pronouns in speech
-        "thing", "things", "something", "anything", "everything", "someone",
-        "everyone", "people", "person", "way", "ways", "time", "times",
-        "today", "tonight", "year", "years", "day", "days", "week", "weeks",
-        "month", "months", "number", "part", "point", "fact", "case", "end",
-        "work", "place", "state", "area", "issue", "issues", "matter",
-        # Common speech fillers & generic words
-        "gonna", "gotta", "kinda", "sorta", "kind", "sort", "lot", "lots", "bit",
-        "many", "every", "even", "still", "already", "always", "never", "often",
-        "first", "last", "next", "new", "long", "different", "important",
-        "able", "enough", "ago", "away", "around", "across",
-        # Generic action verbs
-        "look", "come", "came", "back", "make", "made", "take", "took",
-        "get", "got", "say", "said", "tell", "told", "let", "put",
-        "give", "gave", "see", "saw", "one", "two", "three", "keep",
-        "call", "called", "ask", "asked", "move", "moved", "bring", "brought",
-        "set", "start", "started", "continue", "continued", "support",
-        "present", "presented", "pass", "passed",
-        # Titles used in address (not meaningful as standalone words)
-        "mr", "mrs", "ms", "dr",
-        # Meeting-specific filler (not policy content)
-        "speaker", "colleagues", "colleague", "members", "member",
-        "majority", "leader", "intro", "introduction",
-        # Civic meeting title words (said frequently but not meaningful content)
-        "select", "board", "selectboard", "committee", "council",
-        "city", "town", "village", "county", "borough",
-        "meeting", "session", "hearing", "agenda",
-        "planning", "zoning", "school", "finance", "budget",
-        "commission", "authority", "department", "office",
-        "public", "regular", "special", "annual", "monthly", "weekly",
-        "minutes", "motion", "second", "vote", "aye", "nay",
-        "resolution", "ordinance", "amendment", "warrant",
-        "stated", "live", "watch", "recording", "video",
-    }
-
-    stop_words.update(civic_stopwords)
-
-    words = re.findall(r"\b[a-zA-Z]{3,}\b", transcript.lower())
-    word_counts = Counter(w for w in words if w not in stop_words)
-
+    most_common = word_counts.most_common(50)
     top_words = [
-        {"text": fix_brooklyn(word), "count": count} for word, count in word_counts.most_common(50)
+        {"text": word, "count": count}
+        for word, (_, count) in zip(fix_brooklyn_batch([w for w, _ in most_common]), most_common)
     ]
 
     return {"words": top_words}
@@ -2191,9 +2750,9 @@ async def summary_ai(req: Request):
                 result["summarySentences"] = fix_brooklyn(ss)
             elif isinstance(ss, list):
                 # Timestamped sentences array — fix text in each sentence
-                for s in ss:
-                    if isinstance(s, dict) and "text" in s and isinstance(s["text"], str):
-                        s["text"] = fix_brooklyn(s["text"])
+                items = [s for s in ss if isinstance(s, dict) and isinstance(s.get("text"), str)]
+                for s, text in zip(items, fix_brooklyn_batch([s["text"] for s in items])):
+                    s["text"] = text
         if isinstance(result, dict) and "headline" in result:
             result["headline"] = fix_brooklyn(result.get("headline", ""))
         return result
@@ -2228,11 +2787,16 @@ async def _summary_ai_impl(req: Request):
         raise HTTPException(400, "No transcript provided")
 
     video_id = data.get("video_id", "")
+    if not video_id:
+        # video_id is only used for caching here; without one, cache under
+        # the transcript's content hash so repeat requests still hit
+        import hashlib
+        video_id = "t" + hashlib.blake2b(transcript.encode(), digest_size=16).hexdigest()
     # Cache key includes reel_style so different styles get separate caches
     cache_strategy_key = f"summary_{strategy}_{reel_style}" if reel_style else f"summary_{strategy}"
     print(f"[summary_ai] Processing transcript: {len(transcript):,} characters, strategy={strategy}, model={model}, reel_style={reel_style}, force_refresh={force_refresh}")
 
-    # Check cache first (if video_id provided)
+    # Check cache first
     if video_id and not force_refresh:
         try:
             # Check timestamped cache first for executive strategy
@@ -2291,7 +2855,7 @@ Return ONLY valid JSON in this format:
 TRANSCRIPT:
 {timestamped_transcript[:30000]}"""
 
-        ai_result = call_ai_api(
+        ai_result = await call_ai_api_async(
             prompt=user_prompt,
             max_tokens=1000,
             model=model,
@@ -2322,8 +2886,8 @@ TRANSCRIPT:
                 if isinstance(sentences, list) and len(sentences) > 0:
                     # Filter to only complete sentence objects and fix Brooklyn→Brookline
                     valid = [s for s in sentences if isinstance(s, dict) and s.get("text") and len(s["text"]) > 10]
-                    for s in valid:
-                        s["text"] = fix_brooklyn(s["text"])
+                    for s, text in zip(valid, fix_brooklyn_batch([s["text"] for s in valid])):
+                        s["text"] = text
                     if valid:
                         result = {"summarySentences": valid, "strategy": strategy, "hasTimestamps": True}
                         if video_id:
@@ -2358,27 +2922,32 @@ TRANSCRIPT:
 
     # Gemini has 1M token context — skip chunking entirely
     if use_gemini:
-        chunks, needs_processing = [transcript], False
+        chunks, needs_processing = [(0, len(transcript))], False
     else:
         chunks, needs_processing = chunk_transcript_with_overlap(transcript, model)
 
     if needs_processing and len(chunks) > 1:
         print(f"[summary_ai] Using map-reduce for {len(chunks)} chunks (parallel)")
 
-        # Parallel chunk processing via ThreadPoolExecutor
+        # Map step: chunks run concurrently (at most 3 in flight) and the
+        # key points stay in transcript order for the synthesis prompt
+        chunk_slots = asyncio.Semaphore(3)
+
+        async def _extract(i, bounds):
+            async with chunk_slots:
+                return await run_ai_call(
+                    extract_key_points_from_chunk, transcript, *bounds, i + 1, len(chunks), model
+                )
+
+        results = await asyncio.gather(
+            *(_extract(i, bounds) for i, bounds in enumerate(chunks)), return_exceptions=True
+        )
         all_key_points = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(extract_key_points_from_chunk, chunk, i + 1, len(chunks), model): i
-                for i, chunk in enumerate(chunks)
-            }
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result:
-                        all_key_points.append(result)
-                except Exception as e:
-                    print(f"   Chunk extraction error: {e}")
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"   Chunk extraction error: {result}")
+            elif result:
+                all_key_points.append(result)
 
         if not all_key_points:
             print("Ãƒâ€šÃ‚Â  Key point extraction failed, using fallback")
@@ -2389,7 +2958,9 @@ TRANSCRIPT:
             }
 
         print(f"[summary_ai] Synthesizing final {strategy}...")
-        ai_result = synthesize_full_meeting(all_key_points, model, strategy, reel_style=reel_style)
+        ai_result = await run_ai_call(
+            synthesize_full_meeting, all_key_points, model, strategy, reel_style=reel_style
+        )
 
         if ai_result:
             if strategy == "highlights_with_quotes":
@@ -2809,7 +3380,7 @@ COMPLETE TRANSCRIPT:
 
 Write a thorough, well-organized summary that captures the full scope of the meeting."""
 
-    ai_result = call_ai_api(
+    ai_result = await call_ai_api_async(
         prompt=user_prompt,
         max_tokens=3000,  # More tokens for comprehensive summary
         model=model,
@@ -2850,7 +3421,7 @@ Preserve all timestamps in their original format."""
         max_chars = 400000
         truncated_text = text[:max_chars] if len(text) > max_chars else text
         prompt = f"{translate_prompt}\n\nTRANSCRIPT:\n{truncated_text}\n\nTRANSLATION ({target_lang}):"
-        ai_result = call_ai_api(prompt, max_tokens=8000, model=model, temperature=0.3)
+        ai_result = await call_ai_api_async(prompt, max_tokens=8000, model=model, temperature=0.3)
         if ai_result:
             return {"translation": ai_result, "target_language": target_lang, "truncated": len(text) > max_chars}
         raise HTTPException(500, "Translation failed")
@@ -2859,7 +3430,7 @@ Preserve all timestamps in their original format."""
     max_chunk = 30000
     if len(text) <= max_chunk:
         prompt = f"{translate_prompt}\n\nTRANSCRIPT:\n{text}\n\nTRANSLATION ({target_lang}):"
-        ai_result = call_ai_api(prompt, max_tokens=4000, model=model, temperature=0.3)
+        ai_result = await call_ai_api_async(prompt, max_tokens=4000, model=model, temperature=0.3)
         if ai_result:
             return {"translation": ai_result, "target_language": target_lang, "truncated": False}
         raise HTTPException(500, "Translation failed")
@@ -2906,6 +3477,7 @@ async def get_metadata(req: Request):
             
             ydl_opts["proxy"] = WEBSHARE_PROXY_URL
 
+        yt_dlp = await load_yt_dlp()
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(
                 f"https://www.youtube.com/watch?v={video_id}", download=False
@@ -2924,11 +3496,22 @@ async def get_metadata(req: Request):
         return {"title": "", "description": "", "duration": 0}
 
 
+# Entity texts the model sometimes returns that are never useful on their own
+_ENTITY_SKIP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "yes", "no", "okay",
+    "meeting", "motion", "vote", "agenda", "discussion",
+    "public", "comment", "member", "staff", "resident",
+    "today", "tomorrow", "week", "month", "year",
+})
+# A PERSON with one of these anywhere in it may be a single name ("Mayor Wu")
+_ENTITY_PERSON_TITLES = ("Mr.", "Ms.", "Mrs.", "Dr.", "Mayor", "Chief", "Director", "President")
+
+
 async def get_ai_entities_improved(transcript, model="gpt-4o"):
     """v5.2: STRICT entity extraction - full names, places, organizations only"""
     if not OPENAI_API_KEY:
         print("[!] No OpenAI key, using fallback")
-        return generate_fallback_entities(transcript)
+        return await asyncio.to_thread(generate_fallback_entities, transcript)
 
     max_chars = 60000
     if len(transcript) > max_chars:
@@ -2942,6 +3525,13 @@ async def get_ai_entities_improved(transcript, model="gpt-4o"):
         )
         transcript = sample
 
+    # Re-analyzing the same meeting sends the same text; reuse the answer
+    import hashlib
+    transcript_hash = hashlib.blake2b(transcript.encode(), digest_size=16).hexdigest()
+    cached = get_cached_result(transcript_hash, "entities_strict", {"model": model})
+    if cached is not None:
+        return cached
+
     system_prompt = """You are a STRICT Named Entity Recognition system. 
 Extract ONLY high-quality, properly named entities.
 
@@ -2995,7 +3585,7 @@ Return valid JSON:
 Be strict - fewer high-quality entities is better than many low-quality ones."""
 
     try:
-        ai_result = call_ai_api(
+        ai_result = await call_ai_api_async(
             prompt=user_prompt,
             max_tokens=800,
             model=model,
@@ -3014,7 +3604,7 @@ Be strict - fewer high-quality entities is better than many low-quality ones."""
             open_brackets = cleaned.count("[") - cleaned.count("]")
             open_braces = cleaned.count("{") - cleaned.count("}")
             cleaned += "]" * max(0, open_brackets) + "}" * max(0, open_braces)
-        result_data = json.loads(cleaned)
+        result_data = loads_json(cleaned)
         entities_list = result_data.get("entities", [])
 
         if not entities_list:
@@ -3022,12 +3612,6 @@ Be strict - fewer high-quality entities is better than many low-quality ones."""
 
         valid_entities = []
         seen = set()
-        
-        # Words to exclude
-        skip_words = {"the", "a", "an", "and", "or", "but", "yes", "no", "okay",
-                     "meeting", "motion", "vote", "agenda", "discussion", 
-                     "public", "comment", "member", "staff", "resident",
-                     "today", "tomorrow", "week", "month", "year"}
 
         for entity in entities_list:
             if not isinstance(entity, dict):
@@ -3040,11 +3624,12 @@ Be strict - fewer high-quality entities is better than many low-quality ones."""
             # Skip short or generic
             if not text or len(text) < 4:
                 continue
-            if text.lower() in skip_words:
+            low = text.lower()
+            if low in _ENTITY_SKIP_WORDS:
                 continue
             
             # Skip duplicates
-            if text.lower() in seen:
+            if low in seen:
                 continue
             
             # STRICT VALIDATION
@@ -3052,7 +3637,7 @@ Be strict - fewer high-quality entities is better than many low-quality ones."""
             
             if entity_type == "PERSON":
                 # Must have space (first + last) or title
-                has_title = any(t in text for t in ["Mr.", "Ms.", "Mrs.", "Dr.", "Mayor", "Chief", "Director", "President"])
+                has_title = any(t in text for t in _ENTITY_PERSON_TITLES)
                 if " " in text or has_title:
                     is_valid = True
                     
@@ -3064,18 +3649,20 @@ Be strict - fewer high-quality entities is better than many low-quality ones."""
             
             if is_valid:
                 # v6.0: Fix Martin Luther -> Martin Luther King truncation
-                if text.lower() == "martin luther":
-                    text = "Martin Luther King"
-                seen.add(text.lower())
+                if low == "martin luther":
+                    text, low = "Martin Luther King", "martin luther king"
+                seen.add(low)
                 valid_entities.append({"text": text, "count": count, "type": entity_type})
 
-        valid_entities.sort(key=lambda x: x["count"], reverse=True)
         print(f"[OK] Extracted {len(valid_entities)} high-quality entities")
-        return valid_entities[:40]
+        # Same as a full sort then [:40] (ties keep model order), O(n log 40)
+        top_entities = heapq.nlargest(40, valid_entities, key=lambda x: x["count"])
+        save_to_cache(transcript_hash, "entities_strict", top_entities, {"model": model})
+        return top_entities
 
     except Exception as e:
         print(f"[!] Entity extraction failed: {e}")
-        return generate_fallback_entities(transcript)
+        return await asyncio.to_thread(generate_fallback_entities, transcript)
 
 
 
@@ -3183,6 +3770,32 @@ async def _ytdlp_search(q: str, maxResults: int = 20):
     return {"items": all_items, "fallback": True, "fallback_reason": "yt-dlp search (YouTube API unavailable)"}
 
 
+# Transient YouTube Data API failures worth another try; quota 403s and
+# 404s are answers, not blips, and go straight back to the caller
+_YOUTUBE_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+async def youtube_api_get(url, params, timeout=15.0, attempts=3):
+    """GET a YouTube Data API endpoint on the shared client, retrying
+    timeouts, connection errors, 429 and 5xx with exponential backoff."""
+    import random
+    for attempt in range(attempts):
+        last_try = attempt == attempts - 1
+        try:
+            resp = await HTTP_ASYNC.get(url, params=params, timeout=timeout)
+        except httpx.TransportError as e:
+            if last_try:
+                raise
+            reason = type(e).__name__
+        else:
+            if last_try or resp.status_code not in _YOUTUBE_RETRY_STATUS:
+                return resp
+            reason = f"status {resp.status_code}"
+        delay = 0.5 * 2 ** attempt + random.uniform(0, 0.25)
+        print(f"[YouTube] {reason}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
 # ============================================================================
 # YouTube Search Cache — reduces API quota usage by caching results server-side
 # ============================================================================
@@ -3277,14 +3890,13 @@ async def youtube_search(q: str, type: str = "video", maxResults: int = 10, orde
             if handle_match:
                 handle = handle_match.group(1)
                 print(f"[YouTube] Detected channel handle: @{handle}")
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        "https://www.googleapis.com/youtube/v3/search",
-                        params={"part": "snippet", "q": f"@{handle}", "type": "channel", "maxResults": 1, "key": api_key},
-                        timeout=15.0
-                    )
+                resp = await youtube_api_get(
+                    "https://www.googleapis.com/youtube/v3/search",
+                    params={"part": "snippet", "q": f"@{handle}", "type": "channel", "maxResults": 1, "key": api_key},
+                    timeout=15.0
+                )
                 if resp.status_code == 200:
-                    ch_items = resp.json().get("items", [])
+                    ch_items = loads_json(resp.content).get("items", [])
                     if ch_items:
                         channel_id = ch_items[0].get("id", {}).get("channelId", "")
                         print(f"[YouTube] Resolved @{handle} -> channel ID: {channel_id}")
@@ -3310,16 +3922,15 @@ async def youtube_search(q: str, type: str = "video", maxResults: int = 10, orde
             if extra_params:
                 params.update(extra_params)
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        "https://www.googleapis.com/youtube/v3/search",
-                        params=params,
-                        timeout=15.0
-                    )
+                resp = await youtube_api_get(
+                    "https://www.googleapis.com/youtube/v3/search",
+                    params=params,
+                    timeout=15.0
+                )
                 if resp.status_code == 200:
-                    return resp.json().get("items", [])
+                    return loads_json(resp.content).get("items", [])
                 elif resp.status_code == 403:
-                    error_body = resp.json() if resp.headers.get('content-type', '').startswith('application/json') else {}
+                    error_body = loads_json(resp.content) if resp.headers.get('content-type', '').startswith('application/json') else {}
                     reason = error_body.get("error", {}).get("errors", [{}])[0].get("reason", "")
                     if reason == "quotaExceeded":
                         print(f"[YouTube] QUOTA EXCEEDED — will fall back to yt-dlp")
@@ -3436,14 +4047,13 @@ async def youtube_channel_videos(channel: str, maxResults: int = 50):
                 handle = handle_match.group(1)
 
             if handle:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        "https://www.googleapis.com/youtube/v3/search",
-                        params={"part": "snippet", "q": f"@{handle}", "type": "channel", "maxResults": 1, "key": api_key},
-                        timeout=15.0
-                    )
+                resp = await youtube_api_get(
+                    "https://www.googleapis.com/youtube/v3/search",
+                    params={"part": "snippet", "q": f"@{handle}", "type": "channel", "maxResults": 1, "key": api_key},
+                    timeout=15.0
+                )
                 if resp.status_code == 200:
-                    ch_items = resp.json().get("items", [])
+                    ch_items = loads_json(resp.content).get("items", [])
                     if ch_items:
                         channel_id = ch_items[0].get("id", {}).get("channelId", "")
                         channel_name = ch_items[0].get("snippet", {}).get("channelTitle", "")
@@ -3452,24 +4062,23 @@ async def youtube_channel_videos(channel: str, maxResults: int = 50):
             return {"items": [], "error": f"Could not find channel: {channel}", "channel_name": ""}
 
         # Get latest videos from channel
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                "https://www.googleapis.com/youtube/v3/search",
-                params={
-                    "part": "snippet",
-                    "channelId": channel_id,
-                    "type": "video",
-                    "maxResults": min(maxResults, 50),
-                    "order": "date",
-                    "key": api_key,
-                },
-                timeout=15.0
-            )
+        resp = await youtube_api_get(
+            "https://www.googleapis.com/youtube/v3/search",
+            params={
+                "part": "snippet",
+                "channelId": channel_id,
+                "type": "video",
+                "maxResults": min(maxResults, 50),
+                "order": "date",
+                "key": api_key,
+            },
+            timeout=15.0
+        )
 
         if resp.status_code != 200:
             return {"items": [], "error": f"YouTube API error: {resp.status_code}", "channel_name": channel_name}
 
-        items = resp.json().get("items", [])
+        items = loads_json(resp.content).get("items", [])
         if not channel_name and items:
             channel_name = items[0].get("snippet", {}).get("channelTitle", "")
 
@@ -3481,6 +4090,11 @@ async def youtube_channel_videos(channel: str, maxResults: int = 50):
         return {"items": [], "error": str(e), "channel_name": ""}
 
 
+# Playlist listings change as meetings are posted, so only a short in-memory TTL
+_playlist_cache = {}  # (playlistId, maxResults) -> { "result": ..., "ts": float }
+_PLAYLIST_CACHE_TTL = 300  # 5 minutes
+
+
 @app.get("/api/youtube-playlist")
 async def youtube_playlist(playlistId: str, maxResults: int = 25):
     """Get videos from a YouTube playlist (used by Issue Tracker playlist feature)"""
@@ -3491,6 +4105,11 @@ async def youtube_playlist(playlistId: str, maxResults: int = 25):
             "error": "YouTube API key not configured. Set YOUTUBE_API_KEY environment variable."
         }
     
+    cache_key = (playlistId, min(maxResults, 50))
+    entry = _playlist_cache.get(cache_key)
+    if entry and time.time() - entry["ts"] < _PLAYLIST_CACHE_TTL:
+        return entry["result"]
+
     try:
         params = {
             "part": "snippet",
@@ -3501,14 +4120,14 @@ async def youtube_playlist(playlistId: str, maxResults: int = 25):
         
         print(f"[YouTube] Loading playlist: {playlistId}")
         
-        response = httpx.get(
+        response = await youtube_api_get(
             "https://www.googleapis.com/youtube/v3/playlistItems",
             params=params,
             timeout=15.0
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = loads_json(response.content)
             # Sort by date (newest first)
             if "items" in data:
                 data["items"] = sorted(
@@ -3517,11 +4136,15 @@ async def youtube_playlist(playlistId: str, maxResults: int = 25):
                     reverse=True
                 )
             print(f"[YouTube] Loaded {len(data.get('items', []))} playlist items")
+            _playlist_cache[cache_key] = {"result": data, "ts": time.time()}
+            # Evict old entries (keep max 200)
+            if len(_playlist_cache) > 200:
+                del _playlist_cache[min(_playlist_cache, key=lambda k: _playlist_cache[k]["ts"])]
             return data
         elif response.status_code == 404:
             return {"items": [], "error": "Playlist not found. Make sure it's a public playlist."}
         elif response.status_code == 403:
-            error_data = response.json()
+            error_data = loads_json(response.content)
             error_msg = error_data.get("error", {}).get("message", "Access denied")
             return {"items": [], "error": f"Access denied: {error_msg}"}
         else:
@@ -3590,7 +4213,7 @@ Respond in this exact JSON format (no markdown):
 }}"""
 
             # Use call_ai_api instead of direct OpenAI client
-            ai_response = call_ai_api(
+            ai_response = await call_ai_api_async(
                 prompt=prompt,
                 max_tokens=800,
                 model="gpt-4o-mini",
@@ -3679,7 +4302,7 @@ Respond in this exact JSON format (no markdown):
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 }
                 
-                response = httpx.get(search_url, headers=headers, timeout=10.0, follow_redirects=True)
+                response = await HTTP_ASYNC.get(search_url, headers=headers, timeout=10.0, follow_redirects=True)
                 
                 if response.status_code == 200:
                     html = response.text
@@ -3756,7 +4379,7 @@ Respond in this exact JSON format (no markdown):
                 try:
                     cc_search_url = f"{portal_url}/api/v2/PublicPortal/SearchEvents"
                     cc_params = {"searchText": video_title[:60], "take": 5}
-                    cc_response = httpx.get(cc_search_url, timeout=10.0, follow_redirects=True)
+                    cc_response = await HTTP_ASYNC.get(cc_search_url, timeout=10.0, follow_redirects=True)
                     if cc_response.status_code == 200:
                         cc_data = cc_response.json()
                         for item in (cc_data if isinstance(cc_data, list) else cc_data.get("items", cc_data.get("data", [])))[:3]:
@@ -3803,14 +4426,14 @@ Respond in this exact JSON format (no markdown):
                     "key": YOUTUBE_API_KEY
                 }
                 
-                yt_response = httpx.get(
+                yt_response = await youtube_api_get(
                     "https://www.googleapis.com/youtube/v3/search",
                     params=yt_params,
                     timeout=10.0
                 )
                 
                 if yt_response.status_code == 200:
-                    yt_data = yt_response.json()
+                    yt_data = loads_json(yt_response.content)
                     for item in yt_data.get("items", [])[:2]:
                         vid_id = item.get("id", {}).get("videoId")
                         snippet = item.get("snippet", {})
@@ -3881,7 +4504,7 @@ Transcript: {transcript_sample[:2000]}
 Return a JSON array of 8 search query strings. Example: ["Brookline Select Board agenda March 2024", "Brookline zoning bylaw amendment"]"""
 
         queries = []
-        result = call_ai_api(prompt, max_tokens=400, model="gemini-2.5-flash" if GOOGLE_API_KEY else "gpt-4o-mini", temperature=0.2, response_format="json_object")
+        result = await call_ai_api_async(prompt, max_tokens=400, model="gemini-2.5-flash" if GOOGLE_API_KEY else "gpt-4o-mini", temperature=0.2, response_format="json_object")
         if result:
             try:
                 parsed = json.loads(result) if isinstance(result, str) else result
@@ -3961,6 +4584,7 @@ async def get_extended_analytics(req: Request):
     questions_count = sum(1 for s in sentences if s.strip().endswith("?"))
     statements_count = len(sentences) - questions_count
 
+    from textblob import TextBlob
     sentiment_timeline = []
     for i in range(0, len(sentences), 10):
         if i < len(sentences):
@@ -5277,6 +5901,7 @@ def simple_job(job_id, vid, clips, format_type="combined", captions_enabled=True
     job = JOBS[job_id]
     job["status"] = "running"
     job["percent"] = 5
+    wait_for_ytdlp_update(job)
     job["message"] = "Preparing video download..."
     job["logs"] = []
     # Estimate total time: ~10s per clip for download+encode + 15s overhead
@@ -6532,6 +7157,7 @@ def multi_video_job(job_id, clips_by_video, format_type, captions_enabled):
     job = JOBS[job_id]
     job["status"] = "processing"
     job["percent"] = 0
+    wait_for_ytdlp_update(job)
     
     work = tempfile.mkdtemp(prefix="multi_export_")
     all_clip_files = []
@@ -6963,6 +7589,8 @@ async def video_capabilities():
 @app.get("/api/video_formats/{video_id}")
 async def get_video_formats(video_id: str):
     """List available video resolutions/formats for a YouTube video"""
+    if not YTDLP_READY.is_set():
+        await asyncio.to_thread(wait_for_ytdlp_update)
     try:
         cmd = [YTDLP_BIN, "-F", "--no-playlist", f"https://www.youtube.com/watch?v={video_id}"]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
@@ -7034,6 +7662,7 @@ async def clip_thumbnails(req: Request):
                 subprocess.run(cmd, capture_output=True, timeout=10)
             else:
                 # Download a tiny segment just for the thumbnail
+                wait_for_ytdlp_update()
                 seg_file = os.path.join(FILES_DIR, f"thumbseg_{vid}_{i}.mp4")
                 seg_cmd = [
                     YTDLP_BIN, "-f", "bv*[height<=360]+ba/b[height<=360]/bv*+ba/b",
@@ -7122,6 +7751,7 @@ async def download_mp4(req: Request):
 
     def _run_download():
         job = JOBS[dl_job_id]
+        wait_for_ytdlp_update(job)
         try:
             cmd = [
                 YTDLP_BIN,
@@ -7738,6 +8368,7 @@ async def analyze_chat_sentiment(req: Request):
         negative = 0
         neutral = 0
 
+        from textblob import TextBlob
         for message in chat:
             text = message.get("message", "")
             if text:
@@ -7797,6 +8428,9 @@ async def analyze_chat_sentiment(req: Request):
         raise HTTPException(500, f"Failed to analyze chat: {str(e)}")
 
 
+_CHAT_NON_WORD_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+
 @app.post("/api/live_chat/wordcloud")
 async def chat_wordcloud(req: Request):
     """
@@ -7821,12 +8455,7 @@ async def chat_wordcloud(req: Request):
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     try:
-        # Download stopwords if not available
-        try:
-            stop_words = set(stopwords.words("english"))
-        except:
-            nltk.download("stopwords", quiet=True)
-            stop_words = set(stopwords.words("english"))
+        stop_words = set(get_english_stopwords())
 
         print(f"  Generating word cloud for: {video_id}")
         chat = ChatDownloader().get_chat(url, max_messages=max_messages)
@@ -7837,7 +8466,7 @@ async def chat_wordcloud(req: Request):
         for message in chat:
             text = message.get("message", "").lower()
             # Remove special characters but keep spaces
-            text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
+            text = _CHAT_NON_WORD_RE.sub("", text)
             words = text.split()
             # Filter out stopwords and short words
             filtered_words = [w for w in words if w not in stop_words and len(w) > 3]
@@ -8006,10 +8635,10 @@ async def websocket_live_meeting(websocket: WebSocket, meeting_id: str):
                 await live_manager.send_highlight(meeting_id, data["data"])
 
     except WebSocketDisconnect:
-        await live_manager.disconnect(meeting_id)
+        await live_manager.disconnect(meeting_id, websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
-        await live_manager.disconnect(meeting_id)
+        await live_manager.disconnect(meeting_id, websocket)
 
 
 @app.post("/api/live/start_monitoring")
@@ -8230,7 +8859,7 @@ async def chat_with_meeting(req: Request):
         if "error" in ctx:
             return {"answer": ctx["error"], "sources": [], "suggestions": ["Load a YouTube video"]}
 
-        answer = call_ai_api(ctx["user_prompt"], max_tokens=500, model=model, temperature=0.7, system_prompt=ctx["system_prompt"])
+        answer = await call_ai_api_async(ctx["user_prompt"], max_tokens=500, model=model, temperature=0.7, system_prompt=ctx["system_prompt"])
         if not answer:
             return {"answer": "Sorry, I couldn't generate a response. Please try again.", "sources": [], "suggestions": []}
 
@@ -8665,6 +9294,7 @@ async def add_meeting_to_knowledge_base(req: Request):
             if WEBSHARE_PROXY_URL:
                 
                 ydl_opts["proxy"] = WEBSHARE_PROXY_URL
+            yt_dlp = await load_yt_dlp()
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(
                     f"https://youtube.com/watch?v={video_id}", download=False
@@ -8980,6 +9610,7 @@ async def add_meeting_to_knowledge_base_stream(req: Request):
                 ydl_opts = {"quiet": True, "no_warnings": True}
                 if WEBSHARE_PROXY_URL:
                     ydl_opts["proxy"] = WEBSHARE_PROXY_URL
+                yt_dlp = await load_yt_dlp()
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     info = ydl.extract_info(f"https://youtube.com/watch?v={video_id}", download=False)
                     meta = {
@@ -9043,7 +9674,7 @@ Return ONLY valid JSON with this structure:
 
 Transcript:
 {transcript_preview}"""
-                entity_result = call_ai_api(entity_prompt, max_tokens=800, model=_ingest_model, temperature=0.1, response_format="json_object")
+                entity_result = await call_ai_api_async(entity_prompt, max_tokens=800, model=_ingest_model, temperature=0.1, response_format="json_object")
                 if entity_result:
                     if isinstance(entity_result, dict):
                         entity_json = entity_result
@@ -9079,7 +9710,7 @@ If you find no formal decisions, still extract key discussion topics as type "di
 
 Transcript:
 {transcript_preview}"""
-                decision_result = call_ai_api(decision_prompt, max_tokens=2000, model=_ingest_model, temperature=0.1, response_format="json_object")
+                decision_result = await call_ai_api_async(decision_prompt, max_tokens=2000, model=_ingest_model, temperature=0.1, response_format="json_object")
                 if decision_result:
                     if isinstance(decision_result, dict):
                         decision_json = decision_result
@@ -9106,7 +9737,7 @@ Transcript:
 
 Transcript:
 {transcript_preview}"""
-                summary_result = call_ai_api(summary_prompt, max_tokens=300, model=_ingest_model, temperature=0.3)
+                summary_result = await call_ai_api_async(summary_prompt, max_tokens=300, model=_ingest_model, temperature=0.3)
                 if summary_result:
                     summary_text = summary_result if isinstance(summary_result, str) else str(summary_result)
                     meetings_collection.upsert(
@@ -9516,7 +10147,7 @@ Example: ["Budget Allocation", "Public Safety", "Zoning Changes", "School Fundin
 Meetings:
 {chr(10).join(summaries[:20])}"""
 
-        topic_result = call_ai_api(topic_prompt, max_tokens=200, model="gemini-2.5-flash", temperature=0.1, response_format="json_object")
+        topic_result = await call_ai_api_async(topic_prompt, max_tokens=200, model="gemini-2.5-flash", temperature=0.1, response_format="json_object")
         topics = []
         if topic_result:
             try:
@@ -9647,7 +10278,7 @@ async def kb_issue_ai_summary(req: Request):
             narrative_prompt = f"""Analyze how the issue "{issue['name']}" has evolved across these civic meetings. Write a 3-5 paragraph narrative summarizing the lifecycle, key developments, and current status.
 
 {chr(10).join(excerpts[:8])}"""
-            narrative = call_ai_api(narrative_prompt, max_tokens=600, model="gemini-2.5-flash", temperature=0.3)
+            narrative = await call_ai_api_async(narrative_prompt, max_tokens=600, model="gemini-2.5-flash", temperature=0.3)
             if narrative:
                 return {"narrative": narrative if isinstance(narrative, str) else str(narrative), "issue": issue}
 
@@ -9849,7 +10480,7 @@ Return ONLY valid JSON with this structure:
 
 Transcript:
 {transcript_preview}"""
-                    entity_result = call_ai_api(entity_prompt, max_tokens=800, model=_enrich_model, temperature=0.1, response_format="json_object")
+                    entity_result = await call_ai_api_async(entity_prompt, max_tokens=800, model=_enrich_model, temperature=0.1, response_format="json_object")
                     if entity_result:
                         if isinstance(entity_result, dict):
                             entity_json = entity_result
@@ -9886,7 +10517,7 @@ If you find no formal decisions, still extract key discussion topics as type "di
 Transcript:
 {transcript_preview}"""
                     print(f"[KB Enrich] Decision prompt length: {len(decision_prompt)} chars, model: {_enrich_model}")
-                    decision_result = call_ai_api(decision_prompt, max_tokens=2000, model=_enrich_model, temperature=0.1, response_format="json_object")
+                    decision_result = await call_ai_api_async(decision_prompt, max_tokens=2000, model=_enrich_model, temperature=0.1, response_format="json_object")
                     print(f"[KB Enrich] Decision result type: {type(decision_result)}, length: {len(str(decision_result)) if decision_result else 0}")
                     print(f"[KB Enrich] Decision result preview: {str(decision_result)[:500] if decision_result else 'None'}")
                     if decision_result:
@@ -9918,7 +10549,7 @@ Transcript:
 
 Transcript:
 {transcript_preview}"""
-                    summary_result = call_ai_api(summary_prompt, max_tokens=300, model=_enrich_model, temperature=0.3)
+                    summary_result = await call_ai_api_async(summary_prompt, max_tokens=300, model=_enrich_model, temperature=0.3)
                     if summary_result:
                         summary_text = summary_result if isinstance(summary_result, str) else str(summary_result)
                         meetings_collection.upsert(
@@ -10002,7 +10633,7 @@ Return ONLY valid JSON with this structure:
 Meetings:
 {chr(10).join(context_parts[:15])}"""
 
-        result = call_ai_api(prompt, max_tokens=1200, model=_model, temperature=0.3, response_format="json_object")
+        result = await call_ai_api_async(prompt, max_tokens=1200, model=_model, temperature=0.3, response_format="json_object")
         if result:
             try:
                 parsed = json.loads(result) if isinstance(result, str) else result
@@ -10306,6 +10937,7 @@ async def compare_two_meetings(req: Request):
                 if WEBSHARE_PROXY_URL:
                     
                     ydl_opts["proxy"] = WEBSHARE_PROXY_URL
+                yt_dlp = await load_yt_dlp()
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     info = ydl.extract_info(f"https://youtube.com/watch?v={mid}", download=False)
                     metadata[mid] = {
@@ -10339,6 +10971,7 @@ async def compare_two_meetings(req: Request):
 
         def get_sentiment_score(text):
             try:
+                from textblob import TextBlob
                 blob = TextBlob(text[:5000])
                 return {"polarity": round(blob.sentiment.polarity, 3), "subjectivity": round(blob.sentiment.subjectivity, 3)}
             except:
@@ -10446,6 +11079,7 @@ async def get_clip_preview(req: Request):
             if WEBSHARE_PROXY_URL:
                 
                 ydl_opts["proxy"] = WEBSHARE_PROXY_URL
+            yt_dlp = await load_yt_dlp()
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(
                     f"https://youtube.com/watch?v={video_id}", download=False
@@ -11100,7 +11734,7 @@ Original text:
 
 Provide the simplified version:"""
     
-    result = call_openai_api(
+    result = await call_openai_api_async(
         prompt=prompt,
         max_tokens=1000,
         model="gpt-4o-mini",
@@ -11128,7 +11762,7 @@ Text to translate:
 
 {target_language} translation:"""
     
-    result = call_openai_api(
+    result = await call_openai_api_async(
         prompt=prompt,
         max_tokens=1500,
         model="gpt-4o-mini",
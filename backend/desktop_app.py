@@ -16,11 +16,11 @@ If pywebview is not installed, the app opens in your default browser.
 """
 
 import os
+import signal
 import sys
 import time
 import threading
 import webbrowser
-import socket
 
 # Configuration
 APP_NAME = "Community Highlighter"
@@ -29,6 +29,11 @@ DEFAULT_PORT = 8000
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
 
+# Set by the server thread once Uvicorn's startup finishes (or fails);
+# _server_started tells main which of the two happened
+SERVER_READY = threading.Event()
+_server_started = False
+
 def update_ytdlp():
     """Update yt-dlp to the latest nightly version from GitHub.
     YouTube frequently blocks older versions, so this is critical for video downloads."""
@@ -79,20 +84,21 @@ def update_ytdlp():
 def setup_environment():
     """Configure environment for desktop mode"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
+    
+    # No chdir: the AI cache was the only thing resolved against the CWD,
+    # so anchor it to the app folder explicitly
+    os.environ.setdefault("AI_CACHE_DIR", os.path.join(script_dir, "ai_cache"))
     
     # CRITICAL: Ensure desktop mode (enables video download features)
     # This must be set BEFORE importing the FastAPI app
     os.environ["CLOUD_MODE"] = "false"
     print("[*] CLOUD_MODE=false (video downloads enabled)")
     
-    # Add directories to Python path
-    if script_dir not in sys.path:
-        sys.path.insert(0, script_dir)
-    
+    # Add directories to Python path in one go (backend/ ends up first)
     backend_dir = os.path.join(script_dir, "backend")
-    if os.path.exists(backend_dir) and backend_dir not in sys.path:
-        sys.path.insert(0, backend_dir)
+    candidates = [backend_dir] if os.path.exists(backend_dir) else []
+    candidates.append(script_dir)
+    sys.path[:0] = [p for p in candidates if p not in sys.path]
     
     return script_dir
 
@@ -160,23 +166,19 @@ def check_prerequisites(script_dir):
 def start_server(app, port):
     """Start the FastAPI server"""
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
-
-def wait_for_server(port, timeout=30):
-    """Wait for server to be available"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('127.0.0.1', port))
-            sock.close()
-            if result == 0:
-                return True
-        except:
-            pass
-        time.sleep(0.5)
-    return False
+    
+    class NotifyingServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            global _server_started
+            await super().startup(sockets=sockets)
+            _server_started = not self.should_exit
+            SERVER_READY.set()
+    
+    try:
+        NotifyingServer(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="info")).run()
+    finally:
+        # Wake main() if startup failed (e.g. port already in use)
+        SERVER_READY.set()
 
 def open_native_window(url):
     """Try to open a native window"""
@@ -205,8 +207,14 @@ def open_in_browser(url):
     print("=" * 50 + "\n")
     
     try:
-        while True:
-            time.sleep(1)
+        if hasattr(signal, 'pause'):
+            # Sleep until a signal arrives instead of waking every second
+            while True:
+                signal.pause()
+        else:
+            # Windows has no pause(), and Ctrl+C can't interrupt a bare wait()
+            while True:
+                time.sleep(1)
     except KeyboardInterrupt:
         print("\n[*] Shutting down...")
 
@@ -255,7 +263,7 @@ def main():
     threading.Thread(target=start_server, args=(app, DEFAULT_PORT), daemon=True).start()
     
     print("[*] Waiting for server...")
-    if not wait_for_server(DEFAULT_PORT):
+    if not SERVER_READY.wait(timeout=30) or not _server_started:
         print("[ERROR] Server failed to start")
         sys.exit(1)
     
@@ -4,11 +4,118 @@ Use regex/rules for simple extractions instead of expensive AI
 Saves $0.40 per analysis
 """
 
-import re
-from typing import List, Dict, Set
+try:
+    # RE2 compiles to a DFA: linear-time matching and no catastrophic
+    # backtracking on long transcripts.
+    import re2 as re
+except ImportError:
+    import re
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Optional, Set
 from datetime import datetime, timedelta
 import dateparser
 
+# Patterns are compiled once at import; the extractors below run on every
+# transcript and would otherwise re-resolve each pattern through re's cache.
+# Case-insensitivity is set inline with (?i) since RE2 does not take re flags.
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+
+# (123) 456-7890 first so the bare-digit branch never backtracks over it;
+# the second branch covers 123-456-7890, 123.456.7890, 123 456 7890 and 1234567890.
+_PHONE_PATTERN = r'\(\d{3}\)\s*\d{3}[-.]?\d{4}|\b\d{3}[-. ]?\d{3}[-. ]?\d{4}\b'
+
+_DATE_PATTERN = (
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b'
+    r'|\b\d{1,2}/\d{1,2}/\d{2,4}\b'
+    r'|\b\d{1,2}-\d{1,2}-\d{2,4}\b'
+    r'|\bnext\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b'
+    r'|\b(?:today|tomorrow|yesterday)\b'
+)
+
+# The number and multiplier are captured so amounts are read straight off
+# the match instead of re-parsing the matched text.
+_MONEY_PATTERN = (
+    r'\$\s*(?P<money_num>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)(?:\s*(?P<money_mult>million|billion|thousand|[MBK])\b)?'
+    r'|(?P<dollar_num>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*dollars?'
+)
+_MONEY_MULTIPLIERS = {
+    'million': 1_000_000, 'm': 1_000_000,
+    'billion': 1_000_000_000, 'b': 1_000_000_000,
+    'thousand': 1_000, 'k': 1_000,
+}
+
+# Pattern for US addresses. The street name is a short lazy run ending at the
+# first whole-word suffix (longest suffixes first), so "123 Main Street and
+# the first" stops at "Street" rather than running on to "fir|st".
+_ADDRESS_PATTERN = (
+    r'\d+\s+[\w\s]{1,60}?\b'
+    r'(?:(?:Boulevard|Street|Avenue|Highway|Parkway|Drive|Court|Place|Road|Lane)\b'
+    r'|(?:Blvd|Ave|Hwy|Pkwy|Dr|Ct|Pl|Rd|Ln|St)\b\.?)'
+)
+
+_URL_PATTERN = r'https?://[^\s<>"{}|\\^`\[\]]+'
+
+_PERCENT_PATTERN = r'\b(?P<percent_value>\d+(?:\.\d+)?)(?:%|\s*percent\b)'
+
+_EMAIL_RE = re.compile(r'(?i)' + _EMAIL_PATTERN)
+_PHONE_RE = re.compile(_PHONE_PATTERN)
+_DATE_RE = re.compile(r'(?i)' + _DATE_PATTERN)
+_MONEY_RE = re.compile(r'(?i)' + _MONEY_PATTERN)
+_ADDRESS_RE = re.compile(r'(?i)' + _ADDRESS_PATTERN)
+_URL_RE = re.compile(_URL_PATTERN)
+_PERCENT_RE = re.compile(r'(?i)' + _PERCENT_PATTERN)
+
+
+# One scanner for extract_all_structured_data: a single finditer sweep,
+# dispatched on match.lastgroup. The leftmost match wins, so a URL with an @
+# in it is reported as a URL because it starts first; the order below only
+# breaks ties between kinds that match at the same position (first listed
+# wins). Addresses stay out: the street-name run would swallow dates and
+# amounts inside its span.
+_MASTER_PARTS = (
+    ('email', _EMAIL_PATTERN),
+    ('url', _URL_PATTERN),
+    ('phone', _PHONE_PATTERN),
+    ('money', _MONEY_PATTERN),
+    ('percent', _PERCENT_PATTERN),
+    ('date', _DATE_PATTERN),
+)
+_MASTER_PATTERN = '|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in _MASTER_PARTS)
+_MASTER_RE = re.compile(r'(?i)' + _MASTER_PATTERN)
+
+# Each branch is wrapped in a named group so match.lastgroup tells callers
+# which phrasing matched; the tallies live in <branch>_yes / <branch>_no.
+_VOTE_PATTERN = (
+    r'(?P<voted>(?:voted?|voting)\s+(?P<voted_yes>\d+)\s*(?:to|-)\s*(?P<voted_no>\d+))'
+    r'|(?P<tally>(?P<tally_yes>\d+)\s+(?:in favor|ayes?)\s+(?:and\s+)?(?P<tally_no>\d+)\s+(?:opposed|nays?|against))'
+    r'|(?P<motion>motion\s+(?:passes|passed|fails|failed)\s+(?P<motion_yes>\d+)\s*(?:to|-)\s*(?P<motion_no>\d+))'
+)
+_VOTE_RE = re.compile(r'(?i)' + _VOTE_PATTERN)
+
+# The deadline branch starts only at word boundaries: a clause that fails from
+# its first word fails from every later letter too, and without the anchor a
+# backtracking engine (the stdlib fallback) retries it at each letter.
+_ACTION_RE = re.compile(
+    r'(?i)(?:need to|must|should|will|shall)\s+(?P<intent>[^.!?]{10,100})'
+    r'|(?:action item|to do|task):\s*(?P<label>[^.!?]{10,100})'
+    r'|(?P<deadline>\b[A-Z][^.!?]*(?:by|before|until)\s+(?:next|the)\s+\w+[^.!?]*[.!?])'
+)
+
+# Lowercased twins of the scanners used by extract_all_structured_data. They
+# run over text.lower() so the engine does no case folding per character;
+# matched text is sliced back out of the original by span. Lowercasing the
+# pattern source is safe because it only uses lowercase escapes (\b \d \s \w).
+def _lowercase_pattern(pattern: str) -> str:
+    return pattern.lower().replace('(?p<', '(?P<')
+
+_MASTER_LOWER_RE = re.compile(_lowercase_pattern(_MASTER_PATTERN))
+_VOTE_LOWER_RE = re.compile(_lowercase_pattern(_VOTE_PATTERN))
+
 def extract_emails_regex(text: str) -> List[str]:
     """
     Extract email addresses using regex (free vs $0.01 with AI)
@@ -19,9 +126,9 @@ def extract_emails_regex(text: str) -> List[str]:
     Returns:
         List of unique email addresses
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text, re.IGNORECASE)
-    return list(set(emails))
+    if '@' not in text:
+        return []
+    return list(dict.fromkeys(m.group(0) for m in _EMAIL_RE.finditer(text)))
 
 def extract_phone_numbers_regex(text: str) -> List[str]:
     """
@@ -33,17 +140,28 @@ def extract_phone_numbers_regex(text: str) -> List[str]:
     Returns:
         List of phone numbers
     """
-    patterns = [
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # 123-456-7890 or 1234567890
-        r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',     # (123) 456-7890
-        r'\b\d{3}\s\d{3}\s\d{4}\b'          # 123 456 7890
-    ]
-    
-    phones = []
-    for pattern in patterns:
-        phones.extend(re.findall(pattern, text))
-    
-    return list(set(phones))
+    return list(dict.fromkeys(m.group(0) for m in _PHONE_RE.finditer(text)))
+
+# Fixed formats the date pattern can produce; strptime handles these without
+# dateparser's locale/language table walk.
+_DATE_FORMATS = ('%m/%d/%Y', '%m/%d/%y', '%m-%d-%Y', '%m-%d-%y', '%B %d, %Y', '%B %d %Y')
+_RELATIVE_DATE_PREFIXES = ('next', 'today', 'tomorrow', 'yesterday')
+
+@lru_cache(maxsize=4096)
+def _parse_absolute_date(date_text: str):
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+    return dateparser.parse(date_text, languages=['en'])
+
+def _parse_date(date_text: str):
+    # Relative dates depend on the current day, so they are never cached
+    if date_text.lower().startswith(_RELATIVE_DATE_PREFIXES):
+        return dateparser.parse(date_text, languages=['en'],
+                                settings={'PREFER_DATES_FROM': 'current_period'})
+    return _parse_absolute_date(date_text)
 
 def extract_dates_regex(text: str) -> List[Dict]:
     """
@@ -53,28 +171,20 @@ def extract_dates_regex(text: str) -> List[Dict]:
         text: Text to search
     
     Returns:
-        List of date dictionaries
+        List of date dictionaries (one per distinct date mention)
     """
-    # Common date patterns
-    date_patterns = [
-        r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
-        r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-        r'\b\d{1,2}-\d{1,2}-\d{2,4}\b',
-        r'\bnext\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b',
-        r'\b(?:today|tomorrow|yesterday)\b'
-    ]
-    
+    return _dates_from_matches(_DATE_RE.findall(text))
+
+def _dates_from_matches(matches: List[str]) -> List[Dict]:
     dates = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            parsed = dateparser.parse(match)
-            if parsed:
-                dates.append({
-                    'text': match,
-                    'date': parsed.isoformat(),
-                    'formatted': parsed.strftime('%B %d, %Y')
-                })
+    for match in dict.fromkeys(matches):
+        parsed = _parse_date(match)
+        if parsed:
+            dates.append({
+                'text': match,
+                'date': parsed.isoformat(),
+                'formatted': parsed.strftime('%B %d, %Y')
+            })
     
     return dates
 
@@ -88,35 +198,30 @@ def extract_money_amounts_regex(text: str) -> List[Dict]:
     Returns:
         List of money amount dictionaries
     """
-    patterns = [
-        r'\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?(?:\s*(?:million|billion|thousand|M|B|K))?',
-        r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*dollars?',
-    ]
-    
+    if '$' not in text and 'dollar' not in text.lower():
+        return []
+    return _money_from_matches(_MONEY_RE.finditer(text), text)
+
+def _money_from_matches(matches, text: str) -> List[Dict]:
     amounts = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            # Parse amount
-            amount_str = re.sub(r'[^\d.]', '', match.split()[0])
-            try:
-                amount = float(amount_str)
-                
-                # Handle multipliers
-                if re.search(r'million|M\b', match, re.IGNORECASE):
-                    amount *= 1_000_000
-                elif re.search(r'billion|B\b', match, re.IGNORECASE):
-                    amount *= 1_000_000_000
-                elif re.search(r'thousand|K\b', match, re.IGNORECASE):
-                    amount *= 1_000
-                
-                amounts.append({
-                    'text': match,
-                    'amount': amount,
-                    'formatted': f'${amount:,.2f}'
-                })
-            except ValueError:
-                pass
+    for match in matches:
+        # Parse amount
+        amount_str = (match.group('money_num') or match.group('dollar_num')).replace(',', '')
+        try:
+            amount = float(amount_str)
+            
+            # Handle multipliers
+            multiplier = match.group('money_mult')
+            if multiplier:
+                amount *= _MONEY_MULTIPLIERS[multiplier.lower()]
+            
+            amounts.append({
+                'text': text[match.start():match.end()],
+                'amount': amount,
+                'formatted': f'${amount:,.2f}'
+            })
+        except ValueError:
+            pass
     
     return amounts
 
@@ -130,10 +235,7 @@ def extract_addresses_regex(text: str) -> List[str]:
     Returns:
         List of addresses
     """
-    # Pattern for US addresses
-    address_pattern = r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b'
-    addresses = re.findall(address_pattern, text, re.IGNORECASE)
-    return list(set(addresses))
+    return list(dict.fromkeys(m.group(0) for m in _ADDRESS_RE.finditer(text)))
 
 def extract_urls_regex(text: str) -> List[str]:
     """
@@ -145,9 +247,9 @@ def extract_urls_regex(text: str) -> List[str]:
     Returns:
         List of URLs
     """
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    urls = re.findall(url_pattern, text)
-    return list(set(urls))
+    if 'http' not in text:
+        return []
+    return list(dict.fromkeys(m.group(0) for m in _URL_RE.finditer(text)))
 
 def extract_percentages_regex(text: str) -> List[Dict]:
     """
@@ -159,17 +261,17 @@ def extract_percentages_regex(text: str) -> List[Dict]:
     Returns:
         List of percentage dictionaries
     """
-    pattern = r'\b\d+(?:\.\d+)?%|\b\d+(?:\.\d+)?\s*percent\b'
-    matches = re.findall(pattern, text, re.IGNORECASE)
-    
+    if '%' not in text and 'percent' not in text.lower():
+        return []
+    return _percentages_from_matches(_PERCENT_RE.finditer(text), text)
+
+def _percentages_from_matches(matches, text: str) -> List[Dict]:
     percentages = []
     for match in matches:
-        # Extract numeric value
-        value_str = re.search(r'\d+(?:\.\d+)?', match).group()
         try:
-            value = float(value_str)
+            value = float(match.group('percent_value'))
             percentages.append({
-                'text': match,
+                'text': text[match.start():match.end()],
                 'value': value,
                 'formatted': f'{value}%'
             })
@@ -178,7 +280,7 @@ def extract_percentages_regex(text: str) -> List[Dict]:
     
     return percentages
 
-def count_speakers_simple(sentences: List[Dict]) -> int:
+def count_speakers_simple(sentences: List[Dict]) -> Optional[int]:
     """
     Simple speaker count (if speaker info available in transcript)
     
@@ -186,14 +288,10 @@ def count_speakers_simple(sentences: List[Dict]) -> int:
         sentences: List of sentences with optional 'speaker' field
     
     Returns:
-        Number of unique speakers
+        Number of unique speakers, or None if no sentence has speaker info
     """
-    speakers = set()
-    for sent in sentences:
-        if 'speaker' in sent and sent['speaker']:
-            speakers.add(sent['speaker'])
-    
-    return len(speakers) if speakers else None
+    speakers = {speaker for speaker in (sent.get('speaker') for sent in sentences) if speaker}
+    return len(speakers) or None
 
 def detect_votes_regex(text: str) -> List[Dict]:
     """
@@ -205,28 +303,24 @@ def detect_votes_regex(text: str) -> List[Dict]:
     Returns:
         List of vote dictionaries
     """
-    vote_patterns = [
-        r'(?:voted?|voting)\s+(\d+)\s*(?:to|-)\s*(\d+)',
-        r'(\d+)\s+(?:in favor|ayes?)\s+(?:and\s+)?(\d+)\s+(?:opposed|nays?|against)',
-        r'motion\s+(?:passes|passed|fails|failed)\s+(\d+)\s*(?:to|-)\s*(\d+)'
-    ]
-    
+    return _votes_from_matches(_VOTE_RE.finditer(text), text)
+
+def _votes_from_matches(matches, text: str) -> List[Dict]:
     votes = []
-    for pattern in vote_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            try:
-                yes_votes = int(match.group(1))
-                no_votes = int(match.group(2))
-                votes.append({
-                    'text': match.group(0),
-                    'yes': yes_votes,
-                    'no': no_votes,
-                    'total': yes_votes + no_votes,
-                    'passed': yes_votes > no_votes
-                })
-            except (ValueError, IndexError):
-                pass
+    for match in matches:
+        branch = match.lastgroup
+        try:
+            yes_votes = int(match.group(f'{branch}_yes'))
+            no_votes = int(match.group(f'{branch}_no'))
+            votes.append({
+                'text': text[match.start():match.end()],
+                'yes': yes_votes,
+                'no': no_votes,
+                'total': yes_votes + no_votes,
+                'passed': yes_votes > no_votes
+            })
+        except (ValueError, IndexError):
+            pass
     
     return votes
 
@@ -243,17 +337,35 @@ def extract_all_structured_data(text: str, sentences: List[Dict] = None) -> Dict
     Returns:
         Dictionary with all extracted data
     """
-    print("🔧 Using hybrid rules for structured data extraction...")
+    # Scan the lowercased text with the flag-free patterns unless lowercasing
+    # changed the length (a few non-ASCII characters), which would break spans.
+    text_lower = text.lower()
+    if len(text_lower) == len(text):
+        scan_text, master_re, vote_re = text_lower, _MASTER_LOWER_RE, _VOTE_LOWER_RE
+    else:
+        scan_text, master_re, vote_re = text, _MASTER_RE, _VOTE_RE
+    
+    # Emails, URLs and phones are deduplicated (in text order) as they stream in;
+    # money and percentages keep the match object so captured groups can be read.
+    found = {'email': {}, 'url': {}, 'phone': {}, 'money': [], 'percent': [], 'date': []}
+    for match in master_re.finditer(scan_text):
+        kind = match.lastgroup
+        if kind in ('money', 'percent'):
+            found[kind].append(match)
+        elif kind in ('email', 'url', 'phone'):
+            found[kind][text[match.start():match.end()]] = None
+        else:
+            found[kind].append(text[match.start():match.end()])
     
     return {
-        'emails': extract_emails_regex(text),
-        'phone_numbers': extract_phone_numbers_regex(text),
-        'dates': extract_dates_regex(text),
-        'money_amounts': extract_money_amounts_regex(text),
+        'emails': list(found['email']),
+        'phone_numbers': list(found['phone']),
+        'dates': _dates_from_matches(found['date']),
+        'money_amounts': _money_from_matches(found['money'], text),
         'addresses': extract_addresses_regex(text),
-        'urls': extract_urls_regex(text),
-        'percentages': extract_percentages_regex(text),
-        'votes': detect_votes_regex(text),
+        'urls': list(found['url']),
+        'percentages': _percentages_from_matches(found['percent'], text),
+        'votes': _votes_from_matches(vote_re.finditer(scan_text), text),
         'speaker_count': count_speakers_simple(sentences) if sentences else None
     }
 
@@ -269,10 +381,37 @@ def get_keyword_frequency(text: str, keywords: List[str]) -> Dict[str, int]:
         Dictionary mapping keyword to count
     """
     text_lower = text.lower()
-    return {
-        keyword: len(re.findall(r'\b' + re.escape(keyword.lower()) + r'\b', text_lower))
-        for keyword in keywords
-    }
+    if ahocorasick is None:
+        return {
+            keyword: len(re.findall(r'\b' + re.escape(keyword.lower()) + r'\b', text_lower))
+            for keyword in keywords
+        }
+    
+    # One automaton pass counts every keyword at once
+    automaton = _keyword_automaton(tuple(sorted({k.lower() for k in keywords if k})))
+    counts = Counter()
+    for end, word in automaton.iter(text_lower):
+        start = end - len(word) + 1
+        if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+            counts[word] += 1
+    return {keyword: counts[keyword.lower()] for keyword in keywords}
+
+@lru_cache(maxsize=64)
+def _keyword_automaton(words: tuple):
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Same test as regex \\b: word/non-word transition at pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
 
 def extract_action_items_regex(text: str) -> List[str]:
     """
@@ -284,15 +423,10 @@ def extract_action_items_regex(text: str) -> List[str]:
     Returns:
         List of potential action items
     """
-    action_patterns = [
-        r'(?:need to|must|should|will|shall)\s+([^.!?]{10,100})',
-        r'(?:action item|to do|task):\s*([^.!?]{10,100})',
-        r'([A-Z][^.!?]*(?:by|before|until)\s+(?:next|the)\s+\w+[^.!?]*[.!?])'
-    ]
-    
     action_items = []
-    for pattern in action_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        action_items.extend([m.strip() for m in matches if len(m.strip()) > 10])
+    for match in _ACTION_RE.finditer(text):
+        item = match.group(match.lastgroup).strip()
+        if len(item) > 10:
+            action_items.append(item)
     
-    return list(set(action_items))[:20]  # Limit to top 20
+    return list(dict.fromkeys(action_items))[:20]  # Limit to top 20
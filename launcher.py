@@ -81,12 +81,14 @@ def load_api_key():
     env_path = get_env_path()
     if os.path.exists(env_path):
         try:
-            with open(env_path, 'r') as f:
+            # Binary mode: only the matching line ever gets decoded
+            with open(env_path, 'rb') as f:
                 for line in f:
-                    if line.startswith('OPENAI_API_KEY='):
-                        key = line.split('=', 1)[1].strip()
+                    if line.startswith(b'OPENAI_API_KEY='):
+                        key = line.split(b'=', 1)[1].strip().decode('utf-8', 'ignore')
                         if key and len(key) > 10:
                             return key
+                        break
         except:
             pass
     return ""
@@ -408,30 +410,45 @@ class LauncherApp:
                 "Please enter your OpenAI API key first.")
             return
         
+        # Disable start button
+        self.start_btn.config(state='disabled')
+        self.set_status("Starting...", COLORS['warning'])
+        
+        # Run startup in thread (key save and port probe included, so the
+        # window never blocks on disk or socket I/O)
+        threading.Thread(target=self._startup_thread, args=(key,), daemon=True).start()
+    
+    def _already_running(self):
+        """Called when a server is already listening on the port"""
+        self.set_status("Already running", COLORS['success'])
+        self.url_var.set(f"http://127.0.0.1:{DEFAULT_PORT}")
+        self.start_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+        self.browser_btn.config(state='normal')
+        self.is_running = True
+        self.open_browser()
+    
+    def _startup_thread(self, key):
+        """Handle startup in background thread"""
         # Save key
-        save_api_key(key)
-        self.log("API key saved")
+        try:
+            save_api_key(key)
+        except OSError as e:
+            self.root.after(0, lambda e=e: self.log(f"ERROR: could not save API key: {e}"))
+            self.root.after(0, lambda: self.set_status("Failed to start", COLORS['error']))
+            self.root.after(0, lambda: self.start_btn.config(state='normal'))
+            self.root.after(0, lambda e=e: messagebox.showerror("Save Failed",
+                f"Could not save your API key:\n\n{e}"))
+            return
+        self.root.after(0, lambda: self.log("API key saved"))
         
         # Check if already running
         if is_port_in_use(DEFAULT_PORT):
-            self.set_status("Already running", COLORS['success'])
-            self.url_var.set(f"http://127.0.0.1:{DEFAULT_PORT}")
-            self.start_btn.config(state='disabled')
-            self.stop_btn.config(state='normal')
-            self.browser_btn.config(state='normal')
-            self.is_running = True
-            self.open_browser()
+            self.root.after(0, self._already_running)
             return
         
-        # Disable start button
-        self.start_btn.config(state='disabled')
-        self.set_status("Checking dependencies...", COLORS['warning'])
+        self.root.after(0, lambda: self.set_status("Checking dependencies...", COLORS['warning']))
         
-        # Run startup in thread
-        threading.Thread(target=self._startup_thread, daemon=True).start()
-    
-    def _startup_thread(self):
-        """Handle startup in background thread"""
         # Check if dependencies installed
         if not check_dependencies():
             self.root.after(0, lambda: self.log("Installing dependencies (first run)..."))
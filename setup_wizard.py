@@ -6,10 +6,14 @@ A simple GUI to help users configure their API keys on first run.
 """
 
 import os
+import re
 import sys
 import subprocess
 import webbrowser
 
+# OpenAI keys: "sk-" (incl. sk-proj-/sk-svcacct-) followed by a URL-safe token
+_OPENAI_KEY_MATCH = re.compile(r'^sk-[A-Za-z0-9_-]{20,}$').match
+
 def check_tkinter():
     """Check if tkinter is available"""
     try:
@@ -131,9 +135,9 @@ def run_gui_setup():
                     "Please enter your OpenAI API key to use the app's AI features.")
                 return
             
-            if not api_key.startswith('sk-'):
+            if not _OPENAI_KEY_MATCH(api_key):
                 messagebox.showwarning("Invalid API Key", 
-                    "OpenAI API keys usually start with 'sk-'. Please check your key.")
+                    "OpenAI API keys start with 'sk-' followed by letters, numbers, '-' or '_'. Please check your key.")
                 return
             
             # Save to .env file